@@ -8,6 +8,8 @@ The goal is to demonstrate how to:
 - read autovram env vars
 - apply batch size and precision
 - print an AUTOVRAM_METRIC line
+- optionally serve several trials from one process (--reuse-process)
+- optionally use torch.compile (--compile-mode)
 
 This is not a realistic training loop.
 """
@@ -16,25 +18,28 @@ from __future__ import annotations
 
 import time
 
-from autovram.runtime import get_runtime_config, print_metric
+from autovram.runtime import RuntimeConfig, iter_runtime_configs, print_metric
 
+_compiled: dict[str, object] = {}
 
-def main() -> None:
-    cfg = get_runtime_config()
 
-    try:
-        import torch
+def _matmul(cfg: RuntimeConfig, torch):
+    if cfg.compile_mode is None or not hasattr(torch, "compile"):
+        return lambda x, w: x @ w
+    # Wrap once per mode. With --reuse-process, graphs compiled for a shape are
+    # reused by later trials with the same shape; a new batch size recompiles.
+    if cfg.compile_mode not in _compiled:
+        _compiled[cfg.compile_mode] = torch.compile(lambda x, w: x @ w, mode=cfg.compile_mode)
+    return _compiled[cfg.compile_mode]
 
-        has_torch = True
-    except Exception:
-        torch = None
-        has_torch = False
 
+def run_trial(cfg: RuntimeConfig, torch) -> float:
     # Simulate a tiny workload that scales with batch size.
     steps = 50
+    warmup = 3
     t0 = time.time()
 
-    if has_torch:
+    if torch is not None:
         device = (
             "cuda"
             if torch.cuda.is_available()
@@ -50,10 +55,14 @@ def main() -> None:
             "bf16": torch.bfloat16,
         }.get(cfg.precision, torch.float16)
 
+        matmul = _matmul(cfg, torch)
         x = torch.randn((cfg.micro_batch, 1024), device=device)
         w = torch.randn((1024, 1024), device=device, dtype=dtype)
-        for _ in range(steps):
-            y = x.to(dtype) @ w
+        # Keep compilation and first-touch costs out of the measurement.
+        for step in range(warmup + steps):
+            if step == warmup:
+                t0 = time.time()
+            y = matmul(x.to(dtype), w)
             if device == "cuda":
                 torch.cuda.synchronize()
             _ = y.sum().item()
@@ -62,9 +71,30 @@ def main() -> None:
             _ = sum(i * i for i in range(20000 * max(1, cfg.micro_batch // 2)))
 
     dt = max(time.time() - t0, 1e-9)
-    it_per_s = steps / dt
+    return steps / dt
+
 
-    print_metric(it_per_s=it_per_s)
+def main() -> None:
+    try:
+        import torch
+    except Exception:
+        torch = None
+
+    # Yields once per trial; with `autovram tune --reuse-process` this loops
+    # inside a single process so torch/CUDA are initialized only once.
+    cuda = torch is not None and torch.cuda.is_available()
+    for cfg in iter_runtime_configs():
+        if cuda:
+            torch.cuda.reset_peak_memory_stats()
+        it_per_s = run_trial(cfg, torch)
+        if cuda:
+            # Peak memory lets autovram predict the largest batch size that fits.
+            print_metric(
+                it_per_s=it_per_s, vram_mib=torch.cuda.max_memory_reserved() / (1024 * 1024)
+            )
+            torch.cuda.empty_cache()
+        else:
+            print_metric(it_per_s=it_per_s)
 
 
 if __name__ == "__main__":
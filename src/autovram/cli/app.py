@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import os
+from dataclasses import replace
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.text import Text
 
-from autovram.core.detect import detect_system, system_summary_lines
-from autovram.core.runner import SubprocessRunner
+from autovram.core.detect import detect_system_cached, gpu_local_cpus, system_summary
+from autovram.core.runner import PersistentRunner, SubprocessRunner
+from autovram.core.serialize import config_from_json, to_json
 from autovram.core.tuner import autotune_batch_size, ensure_run_dir
-from autovram.core.types import AutoVRAMConfig, RunContext
+from autovram.core.types import AutoVRAMConfig, RunContext, SystemInfo
 from autovram.engines.base import EngineContext
+from autovram.engines.cache import cached_propose_configs
 from autovram.engines.registry import available_engines, resolve_engine
 from autovram.io.export import export_config
 
@@ -24,26 +26,40 @@ def _autovram_dir() -> Path:
     return Path.cwd() / ".autovram"
 
 
+def _visible_devices(system: SystemInfo) -> list[str]:
+    """CUDA device ids a child may be pinned to, within the parent's own mask."""
+
+    mask = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if mask is not None:
+        return [d.strip() for d in mask.split(",") if d.strip()]
+    device_count = int(system.extra.get("cuda_device_count", 0) or 0)
+    return [str(d) for d in range(device_count)]
+
+
 @app.command()
-def info(json_output: bool = typer.Option(False, "--json", help="Print JSON output")) -> None:
+def info(
+    json_output: bool = typer.Option(False, "--json", help="Print JSON output"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-detect the system instead of using ~/.autovram/system.json"
+    ),
+) -> None:
     """Print a compact system summary."""
 
-    system = detect_system()
+    system = detect_system_cached(force=refresh)
     if json_output:
-        console.print(json.dumps(asdict(system), indent=2))
+        console.print(to_json(system))
         raise typer.Exit(0)
 
-    for line in system_summary_lines(system):
-        console.print(line)
+    console.print(system_summary(system))
 
 
 @app.command()
 def doctor() -> None:
     """Check prerequisites and provide actionable guidance."""
 
-    system = detect_system()
-    for line in system_summary_lines(system):
-        console.print(line)
+    # Always probe the live system here; this also refreshes the on-disk cache.
+    system = detect_system_cached(force=True)
+    console.print(system_summary(system))
 
     console.print("")
 
@@ -87,12 +103,35 @@ def tune(
     engine: str = typer.Option(
         "heuristic", "--engine", help=f"Engine: {', '.join(available_engines())}"
     ),
+    concurrency: int = typer.Option(
+        1, "--concurrency", help="Speculative trials to run in parallel while growing batch size"
+    ),
+    fuse_growth: int = typer.Option(
+        1,
+        "--fuse-growth",
+        help="Run this many growth trials in one process (script must use iter_runtime_configs)",
+    ),
+    reuse_process: bool = typer.Option(
+        False,
+        "--reuse-process",
+        help="Run all trials in one long-lived process (script must use iter_runtime_configs)",
+    ),
+    pin_cpus: bool = typer.Option(
+        False, "--pin-cpus", help="Pin trials to the CPUs local to the GPU (Linux, best-effort)"
+    ),
+    compile_mode: str | None = typer.Option(
+        None,
+        "--compile-mode",
+        help="torch.compile mode passed to the script as AUTOVRAM_COMPILE_MODE (e.g. reduce-overhead)",
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-detect the system instead of using ~/.autovram/system.json"
+    ),
 ) -> None:
     """Tune an ML script by running it multiple times with different env vars."""
 
-    system = detect_system()
-    for line in system_summary_lines(system):
-        console.print(line)
+    system = detect_system_cached(force=refresh)
+    console.print(system_summary(system))
 
     console.print("")
 
@@ -102,13 +141,49 @@ def tune(
         console.print(f"[red]Engine error[/red]: {e}")
         raise typer.Exit(2) from None
 
+    if reuse_process and concurrency > 1:
+        console.print("[red]--reuse-process cannot be combined with --concurrency > 1.[/red]")
+        raise typer.Exit(2)
+
+    if fuse_growth > 1 and reuse_process:
+        console.print(
+            "[red]--fuse-growth cannot be combined with --reuse-process "
+            "(the reused process already amortizes start-up).[/red]"
+        )
+        raise typer.Exit(2)
+
+    if fuse_growth > 1 and concurrency > 1:
+        console.print("[red]--fuse-growth cannot be combined with --concurrency > 1.[/red]")
+        raise typer.Exit(2)
+
+    visible = len(_visible_devices(system))
+    if concurrency > 1 and concurrency > visible:
+        console.print(
+            f"[red]--concurrency {concurrency} needs one GPU per trial ({visible} visible); "
+            "trials sharing a device would contend for memory and throughput.[/red]"
+        )
+        raise typer.Exit(2)
+
     av_dir = _autovram_dir()
     run_dir = ensure_run_dir(av_dir)
 
     console.print(Text(f"Tuning (engine={eng.name}, metric={metric})", style="bold"))
     console.print("────────────────────────────────────────")
 
-    runner = SubprocessRunner()
+    # Spread parallel trials across GPUs; sequential trials keep the inherited devices.
+    devices = _visible_devices(system) if concurrency > 1 else None
+
+    # NUMA-local CPUs are only well-defined when all trials target one GPU.
+    cpu_pin: tuple[int, ...] | None = None
+    if pin_cpus and devices is not None and len(devices) > 1:
+        console.print("[yellow]--pin-cpus: trials span several GPUs; not pinning.[/yellow]")
+    elif pin_cpus:
+        cpu_pin = gpu_local_cpus(system)
+        if cpu_pin is None:
+            console.print("[yellow]--pin-cpus: GPU-local CPUs unknown; not pinning.[/yellow]")
+
+    runner_cls = PersistentRunner if reuse_process else SubprocessRunner
+    runner = runner_cls(cpu_pin=cpu_pin)
     base_ctx = RunContext(
         mode="script",
         system=system,
@@ -123,40 +198,46 @@ def tune(
     best_config: AutoVRAMConfig | None = None
     best_score: float = float("-inf")
 
-    configs = list(eng.propose_configs(EngineContext(run=base_ctx)))
+    configs = cached_propose_configs(eng, EngineContext(run=base_ctx), av_dir / "proposals")
     if not configs:
         console.print("[red]Engine produced no candidate configs.[/red]")
         raise typer.Exit(2)
 
-    for cfg0 in configs:
-        base_config = cfg0
-        cfg, results = autotune_batch_size(
-            context=base_ctx,
-            runner=runner,
-            cmd=cmd,
-            base_config=base_config,
-            max_trials=max_trials,
-        )
-
-        # Print trial lines compactly
-        for idx, rr in enumerate(results, start=1):
-            status = "OK" if rr.ok else ("OOM" if rr.oom else "BAD")
-            metric_str = f"{rr.metric_value:.3f}" if rr.metric_value is not None else "-"
-            console.print(
-                f"Trial {idx:<2d} cfg=batch_size={rr.config.batch_size} precision={rr.config.precision} → {status}  {metric}={metric_str}"
+    try:
+        for cfg0 in configs:
+            base_config = replace(cfg0, compile_mode=compile_mode) if compile_mode else cfg0
+            cfg, results = autotune_batch_size(
+                context=base_ctx,
+                runner=runner,
+                cmd=cmd,
+                base_config=base_config,
+                max_trials=max_trials,
+                concurrency=concurrency,
+                devices=devices,
+                fuse_growth=fuse_growth,
             )
 
-        if cfg is None:
-            continue
-
-        # Pick the best from this precision based on last known best trial score.
-        # (The tuner already tracked best per run; we re-evaluate by rerunning score on cached results.)
-        for rr in results:
-            if rr.ok:
-                s = eng.score_result(rr)
-                if s > best_score:
-                    best_score = s
-                    best_config = rr.config
+            # Print trial lines compactly
+            for idx, rr in enumerate(results, start=1):
+                status = "OK" if rr.ok else ("OOM" if rr.oom else "BAD")
+                metric_str = f"{rr.metric_value:.3f}" if rr.metric_value is not None else "-"
+                console.print(
+                    f"Trial {idx:<2d} cfg=batch_size={rr.config.batch_size} precision={rr.config.precision} → {status}  {metric}={metric_str}"
+                )
+
+            if cfg is None:
+                continue
+
+            # Pick the best from this precision based on last known best trial score.
+            # (The tuner already tracked best per run; we re-evaluate by rerunning score on cached results.)
+            for rr in results:
+                if rr.ok:
+                    s = eng.score_result(rr)
+                    if s > best_score:
+                        best_score = s
+                        best_config = rr.config
+    finally:
+        runner.close()
 
     if best_config is None:
         console.print("[red]No stable configuration found.[/red]")
@@ -170,7 +251,7 @@ def tune(
     console.print("")
     console.print(Text("Best stable config", style="bold"))
     console.print("──────────────────")
-    console.print(json.dumps(asdict(best_config), indent=2))
+    console.print(to_json(best_config))
     console.print("")
     console.print(f"Exported: {cfg_path}")
     console.print(f"Run directory: {run_dir}")
@@ -189,9 +270,8 @@ def tune_vllm(
     it prints guidance and exits.
     """
 
-    system = detect_system()
-    for line in system_summary_lines(system):
-        console.print(line)
+    system = detect_system_cached()
+    console.print(system_summary(system))
 
     try:
         import vllm  # noqa: F401
@@ -221,7 +301,7 @@ def tune_vllm(
 
     console.print("")
     console.print(Text("Exported vLLM starter config", style="bold"))
-    console.print(json.dumps(asdict(cfg), indent=2))
+    console.print(to_json(cfg))
     console.print(f"Exported: {cfg_path}")
 
 
@@ -238,8 +318,11 @@ def export(
         console.print("[red]No config found.[/red] Run `autovram tune ...` first.")
         raise typer.Exit(1)
 
-    raw = json.loads(cfg_in.read_text(encoding="utf-8"))
-    cfg = AutoVRAMConfig(**raw)
+    try:
+        cfg = config_from_json(cfg_in.read_text(encoding="utf-8"))
+    except ValueError as e:
+        console.print(f"[red]Invalid config[/red] in {cfg_in}: {e}")
+        raise typer.Exit(2) from None
 
     out_path = Path(out)
 
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import functools
+import json
+import os
 import platform
 import re
 import sys
 from contextlib import suppress
 from dataclasses import asdict
+from importlib import metadata
+from pathlib import Path
 from typing import Any
 
+from .serialize import to_json
 from .types import SystemInfo
 
 
@@ -19,6 +25,48 @@ def _try_import_torch() -> Any | None:
         return None
 
 
+def _pci_local_cpulist(props: Any) -> str | None:
+    """CPUs on the GPU's NUMA node, as a Linux cpulist string (e.g. "0-15,32-47")."""
+
+    bus = getattr(props, "pci_bus_id", None)
+    if bus is None:
+        return None
+    domain = int(getattr(props, "pci_domain_id", 0))
+    device = int(getattr(props, "pci_device_id", 0))
+    path = Path(f"/sys/bus/pci/devices/{domain:04x}:{int(bus):02x}:{device:02x}.0/local_cpulist")
+    try:
+        return path.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def parse_cpulist(text: str) -> tuple[int, ...]:
+    """Parse a Linux cpulist such as "0-3,8,10-11" into sorted CPU ids."""
+
+    cpus: set[int] = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        cpus.update(range(int(lo), int(hi or lo) + 1))
+    return tuple(sorted(cpus))
+
+
+def gpu_local_cpus(system: SystemInfo) -> tuple[int, ...] | None:
+    """CPUs near the GPU that this process may run on, or None if unknown."""
+
+    raw = system.extra.get("cuda_local_cpus")
+    if not raw or not hasattr(os, "sched_getaffinity"):
+        return None
+    try:
+        cpus = set(parse_cpulist(str(raw))) & os.sched_getaffinity(0)
+    except ValueError:
+        return None
+    return tuple(sorted(cpus)) or None
+
+
+@functools.lru_cache(maxsize=1)
 def detect_system() -> SystemInfo:
     """Detect system information.
 
@@ -50,9 +98,17 @@ def detect_system() -> SystemInfo:
                 gpu_name = str(getattr(props, "name", None))
                 total = int(getattr(props, "total_memory", 0))
                 vram_total_mib = int(total / (1024 * 1024)) if total else None
+                major, minor = torch.cuda.get_device_capability(idx)
+                extra["cuda_cc"] = f"{major}.{minor}"
+                local_cpus = _pci_local_cpulist(props)
+                if local_cpus:
+                    extra["cuda_local_cpus"] = local_cpus
             except Exception as e:
                 extra["cuda_error"] = repr(e)
 
+            with suppress(Exception):
+                extra["cuda_device_count"] = int(torch.cuda.device_count())
+
             # Best-effort versions
             with suppress(Exception):
                 extra["cuda_runtime"] = str(getattr(torch.version, "cuda", None))
@@ -82,28 +138,82 @@ def detect_system() -> SystemInfo:
     )
 
 
-def system_summary_lines(system: SystemInfo) -> list[str]:
-    lines = [
-        "System summary",
-        "──────────────",
-        f"OS: {system.os} ({system.arch})",
-        f"Python: {system.python}",
-        f"PyTorch: {system.torch_version or 'not installed'}",
-        f"Compute: {system.compute}",
-    ]
-
-    if system.gpu_name:
-        lines.append(f"GPU: {system.gpu_name}")
-    if system.vram_total_mib is not None:
-        lines.append(f"VRAM: {system.vram_total_mib} MiB")
+# Bump when `detect_system` starts recording new fields so stale caches are ignored.
+_SYSTEM_CACHE_SCHEMA = "3"
 
+
+def _system_cache_path() -> Path:
+    return Path.home() / ".autovram" / "system.json"
+
+
+def _system_cache_key() -> dict[str, str | None]:
+    """Cheap fingerprint of the environment that does not import torch.
+
+    The torch distribution version carries the CUDA/ROCm build tag (e.g. `+cu121`).
+    """
+
+    try:
+        torch_dist: str | None = metadata.version("torch")
+    except metadata.PackageNotFoundError:
+        torch_dist = None
+    return {
+        "schema": _SYSTEM_CACHE_SCHEMA,
+        "hostname": platform.node(),
+        "python": sys.version,
+        "torch": torch_dist,
+        # The device mask changes the GPU count, names and VRAM that torch reports.
+        "cuda_visible_devices": os.environ.get("CUDA_VISIBLE_DEVICES"),
+        "hip_visible_devices": os.environ.get("HIP_VISIBLE_DEVICES"),
+    }
+
+
+def detect_system_cached(force: bool = False) -> SystemInfo:
+    """Like `detect_system`, but reuse the last result stored in `~/.autovram`.
+
+    The on-disk cache is keyed by hostname, Python, the installed torch
+    distribution and the CUDA/HIP device masks, so a warm CLI invocation does not need to import torch at all.
+    Pass `force=True` to re-detect and refresh the cache.
+    """
+
+    path = _system_cache_path()
+    key = _system_cache_key()
+
+    if not force:
+        with suppress(Exception):
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("key") == key:
+                return SystemInfo(**raw["system"])
+
+    system = detect_system()
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(to_json({"key": key, "system": system}), encoding="utf-8")
+    return system
+
+
+def system_summary(system: SystemInfo) -> str:
+    """Render the system summary as one newline-separated block."""
+
+    extra = system.extra
     # Keep extra compact and stable.
-    if system.extra:
-        for k in sorted(system.extra.keys()):
-            v = system.extra[k]
-            lines.append(f"{k}: {v}")
+    items = extra.items() if len(extra) < 2 else sorted(extra.items())
+    extra_text = "".join(f"\n{k}: {v}" for k, v in items)
+    gpu = f"\nGPU: {system.gpu_name}" if system.gpu_name else ""
+    vram = f"\nVRAM: {system.vram_total_mib} MiB" if system.vram_total_mib is not None else ""
+
+    return (
+        "System summary\n"
+        "──────────────\n"
+        f"OS: {system.os} ({system.arch})\n"
+        f"Python: {system.python}\n"
+        f"PyTorch: {system.torch_version or 'not installed'}\n"
+        f"Compute: {system.compute}"
+        f"{gpu}{vram}{extra_text}"
+    )
 
-    return lines
+
+def system_summary_lines(system: SystemInfo) -> list[str]:
+    return system_summary(system).split("\n")
 
 
 def system_summary_dict(system: SystemInfo) -> dict[str, Any]:
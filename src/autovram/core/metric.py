@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import re
+from .regex import compile_regex
 
-_METRIC_RE = re.compile(r"^AUTOVRAM_METRIC\s+(?P<key>[A-Za-z0-9_]+)=(?P<val>[-+0-9.eE]+)\s*$")
+_METRIC_RE = compile_regex(
+    r"(?m)^[ \t]*AUTOVRAM_METRIC[ \t]+(?P<key>[A-Za-z0-9_]+)=(?P<val>[-+0-9.eE]+)[ \t\r]*$"
+)
 
 
 def parse_metric(stdout: str, metric_name: str) -> float | None:
@@ -14,11 +16,12 @@ def parse_metric(stdout: str, metric_name: str) -> float | None:
     Returns the last seen value for the requested metric name.
     """
 
+    # Most OOM/crashed trials never print a metric; skip the regex scan entirely.
+    if "AUTOVRAM_METRIC" not in stdout:
+        return None
+
     last: float | None = None
-    for line in stdout.splitlines():
-        m = _METRIC_RE.match(line.strip())
-        if not m:
-            continue
+    for m in _METRIC_RE.finditer(stdout):
         if m.group("key") != metric_name:
             continue
         try:
@@ -26,3 +29,22 @@ def parse_metric(stdout: str, metric_name: str) -> float | None:
         except ValueError:
             continue
     return last
+
+
+def parse_metrics(stdout: str) -> dict[str, float]:
+    """Parse all metric lines from stdout in a single pass.
+
+    Returns the last seen value per metric name; use this instead of calling
+    `parse_metric` once per name.
+    """
+
+    if "AUTOVRAM_METRIC" not in stdout:
+        return {}
+
+    metrics: dict[str, float] = {}
+    for m in _METRIC_RE.finditer(stdout):
+        try:
+            metrics[m.group("key")] = float(m.group("val"))
+        except ValueError:
+            continue
+    return metrics
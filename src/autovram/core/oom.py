@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import re
+from typing import Any
+
+from .regex import compile_regex
 
 _OOM_PATTERNS = [
     r"CUDA out of memory",
@@ -11,7 +13,52 @@ _OOM_PATTERNS = [
     r"MPS.*out of memory",
 ]
 
-_OOM_RE = re.compile("|".join(f"(?:{p})" for p in _OOM_PATTERNS), re.IGNORECASE)
+_OOM_RE = compile_regex("(?i)" + "|".join(f"(?:{p})" for p in _OOM_PATTERNS))
+
+# Casefolded substrings; every pattern above contains at least one of these.
+_OOM_HINTS = ("out of memory", "alloc_failed", "hiperroroutofmemory", "cublas")
+
+
+def _build_automaton() -> Any | None:
+    """Aho-Corasick automaton over the casefolded literals behind `_OOM_PATTERNS`.
+
+    "out of memory" and "hiperroroutofmemory" are conclusive on their own; "cublas"
+    still needs an "alloc" later on the same line. Returns None when the optional
+    `pyahocorasick` dependency is not installed.
+    """
+
+    try:
+        import ahocorasick  # type: ignore
+    except Exception:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word in ("out of memory", "hiperroroutofmemory", "cublas"):
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_OOM_AUTOMATON = _build_automaton()
+
+
+def has_oom_hint(text: str) -> bool:
+    """Cheap substring check; False means `looks_like_oom` is False too."""
+
+    low = text.casefold()
+    return any(h in low for h in _OOM_HINTS)
+
+
+def _automaton_match(stderr: str) -> bool:
+    assert _OOM_AUTOMATON is not None
+    low = stderr.casefold()
+    for end, word in _OOM_AUTOMATON.iter(low):
+        if word != "cublas":
+            return True
+        line_end = low.find("\n", end)
+        if "alloc" in low[end + 1 : line_end if line_end != -1 else None]:
+            return True
+    return False
 
 
 def looks_like_oom(stderr: str) -> bool:
@@ -20,4 +67,8 @@ def looks_like_oom(stderr: str) -> bool:
     This is intentionally broad to catch different frameworks.
     """
 
+    if _OOM_AUTOMATON is not None:
+        return _automaton_match(stderr)
+    if not has_oom_hint(stderr):
+        return False
     return bool(_OOM_RE.search(stderr))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+
+def _load_re2() -> Any | None:
+    try:
+        import re2  # type: ignore
+    except Exception:
+        return None
+    return re2
+
+
+_re2 = _load_re2()
+
+
+def compile_regex(pattern: str) -> Any:
+    """Compile `pattern` with RE2 if the optional `google-re2` package is installed.
+
+    RE2 matches in linear time with no backtracking. Pass flags inline (e.g.
+    `(?m)`, `(?i)`) so the pattern means the same to both engines. Patterns RE2
+    rejects fall back to the standard `re` module.
+    """
+
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
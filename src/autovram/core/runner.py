@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import functools
+import json
 import os
+import queue
 import shlex
+import shutil
 import signal
 import subprocess
+import threading
 import time
-from contextlib import suppress
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
-from .oom import looks_like_oom
+from autovram.runtime.runtime import TRIAL_DONE_MARKER
 
+from .oom import has_oom_hint, looks_like_oom
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SubprocessOutcome:
     ok: bool
     exit_code: int | None
@@ -23,42 +33,269 @@ class SubprocessOutcome:
     duration_s: float
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_argv(cmd: str) -> tuple[str, ...]:
+    # shlex is a pure-Python state machine and the tuner reuses one cmd for every
+    # trial, so split and resolve the executable once per command.
+    args = shlex.split(cmd)
+    if args and not os.path.dirname(args[0]):
+        resolved = shutil.which(args[0])
+        if resolved is not None:
+            args[0] = resolved
+    return tuple(args)
+
+
+def _spawn_target(cmd: str, cwd: Path) -> tuple[list[str], str | None]:
+    """Split `cmd` and prepare `Popen` arguments that keep process creation cheap.
+
+    The executable is resolved against PATH once per command, so each child
+    performs a single `execve` instead of probing every PATH entry. `cwd` is
+    dropped when it is already the current directory, which saves a `chdir`
+    in the child.
+
+    Keep `preexec_fn`, `start_new_session` and uid/gid changes out of the
+    `Popen` calls: without them CPython on Linux spawns via `vfork`, which
+    does not copy the parent's page tables. The parent can be large once
+    torch is imported. `posix_spawn` would additionally need
+    `close_fds=False`; that is not forced, since it would hand children any
+    descriptor the parent (or a library it loaded) marked inheritable, and
+    `vfork` already avoids the page-table copy.
+    """
+
+    # Use shell=False to avoid quoting issues; accept cmd string and split.
+    args = list(_resolve_argv(cmd))
+
+    spawn_cwd: str | None = str(cwd)
+    with suppress(OSError):
+        if os.path.samefile(cwd, os.getcwd()):
+            spawn_cwd = None
+    return args, spawn_cwd
+
+
+@contextmanager
+def _spawn_affinity(cpus: tuple[int, ...] | None) -> Iterator[None]:
+    """Temporarily pin the calling thread so a child spawned inside inherits `cpus`.
+
+    On Linux `sched_setaffinity(0, ...)` applies to the calling thread only, and a
+    child inherits the affinity of the thread that spawned it. This pins trials
+    without a `preexec_fn`, which would disable the vfork fast path.
+    """
+
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError:
+        yield
+        return
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def _is_metric_line(line: str) -> bool:
+    return "AUTOVRAM_METRIC" in line
+
+
+def _is_marker_line(line: str) -> bool:
+    return line.rstrip() == TRIAL_DONE_MARKER
+
+
+class _LineBuffer:
+    """Keep a bounded tail of lines plus every line accepted by `keep`.
+
+    Kept lines survive even after they fall out of the tail, so metric and OOM
+    lines are never lost in arbitrarily long logs.
+    """
+
+    def __init__(self, *, tail_lines: int, keep: Callable[[str], bool]) -> None:
+        self._keep = keep
+        self._count = 0
+        self._tail: deque[tuple[int, str]] = deque(maxlen=tail_lines)
+        self._kept: list[tuple[int, str]] = []
+
+    def add(self, line: str) -> None:
+        if self._keep(line):
+            self._kept.append((self._count, line))
+        self._tail.append((self._count, line))
+        self._count += 1
+
+    def text(self) -> str:
+        tail = list(self._tail)
+        first_tail_idx = tail[0][0] if tail else None
+        head = [line for idx, line in self._kept if first_tail_idx is None or idx < first_tail_idx]
+        return "".join(head) + "".join(line for _, line in tail)
+
+
+class _StreamCapture:
+    """Drain a text stream on a background thread into a `_LineBuffer`."""
+
+    def __init__(self, stream: IO[str], *, tail_lines: int, keep: Callable[[str], bool]) -> None:
+        self._stream = stream
+        self._buffer = _LineBuffer(tail_lines=tail_lines, keep=keep)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        with suppress(Exception):
+            for line in self._stream:
+                self._buffer.add(line)
+        with suppress(Exception):
+            self._stream.close()
+
+    def join(self, timeout_s: float) -> None:
+        self._thread.join(timeout_s)
+
+    def text(self) -> str:
+        return self._buffer.text()
+
+
 class SubprocessRunner:
-    """Run commands with timeouts and robust termination."""
+    """Run commands with timeouts and robust termination.
 
-    def run(self, cmd: str, env: dict[str, str], timeout_s: float, cwd: Path) -> SubprocessOutcome:
-        start = time.time()
+    Output is streamed rather than buffered: only the last `tail_lines` lines of
+    each stream are kept, plus every metric line (stdout) and OOM-looking line
+    (stderr).
 
-        merged_env = os.environ.copy()
-        merged_env.update(env)
+    `cpu_pin` restricts trials to a fixed CPU set (Linux only), e.g. the CPUs
+    local to the GPU's NUMA node, to reduce run-to-run noise.
 
-        # Use shell=False to avoid quoting issues; accept cmd string and split.
-        args = shlex.split(cmd)
+    Children inherit `os.environ` as it was when the runner was created.
+    """
 
-        proc = subprocess.Popen(
-            args,
-            cwd=str(cwd),
-            env=merged_env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+    def __init__(self, *, tail_lines: int = 2048, cpu_pin: tuple[int, ...] | None = None) -> None:
+        self.tail_lines = tail_lines
+        self.cpu_pin = cpu_pin
+        # Snapshot once per session instead of copying os.environ for every trial.
+        self._base_env = dict(os.environ)
+
+    def run(self, cmd: str, env: dict[str, str], timeout_s: float, cwd: Path) -> SubprocessOutcome:
+        start = time.time()
+
+        proc = self._popen(cmd, self._base_env | env, cwd)
+        assert proc.stdout is not None and proc.stderr is not None
+        out = _StreamCapture(proc.stdout, tail_lines=self.tail_lines, keep=_is_metric_line)
+        err = _StreamCapture(proc.stderr, tail_lines=self.tail_lines, keep=has_oom_hint)
 
         timed_out = False
         try:
-            stdout, stderr = proc.communicate(timeout=timeout_s)
-            exit_code = proc.returncode
+            exit_code: int | None = proc.wait(timeout=timeout_s)
         except subprocess.TimeoutExpired:
             timed_out = True
-            stdout, stderr = self._terminate_and_collect(proc, kill_after_s=2.0)
-            exit_code = proc.returncode
+            exit_code = self._terminate(proc, kill_after_s=2.0)
 
-        duration_s = time.time() - start
-        oom = looks_like_oom(stderr)
-        ok = (not timed_out) and (exit_code == 0) and (not oom)
+        # Grandchildren may keep the pipes open; don't wait on them forever.
+        out.join(timeout_s=2.0)
+        err.join(timeout_s=2.0)
+        return self._outcome(
+            out.text(),
+            err.text(),
+            exit_code=exit_code,
+            timed_out=timed_out,
+            duration_s=time.time() - start,
+        )
 
+    def run_batch(
+        self, cmd: str, envs: Sequence[dict[str, str]], timeout_s: float, cwd: Path
+    ) -> list[SubprocessOutcome]:
+        """Run several trials in one child process, one per entry of `envs`.
+
+        The child gets `envs[0]` in its environment plus all of `envs` as a JSON
+        array in `AUTOVRAM_CONFIGS`, and runs them in order (see
+        `autovram.runtime.iter_runtime_configs`), so interpreter and CUDA
+        start-up is paid once. Each trial ends with `TRIAL_DONE_MARKER`;
+        `timeout_s` and `duration_s` apply to each trial separately, measured
+        from the previous marker (or from the spawn, for the first trial).
+
+        Trials the child never got to are left out, so the result can be shorter
+        than `envs`: a child that dies or times out (e.g. OOM) ends the batch at
+        that trial, and a script without batch support runs only `envs[0]`.
+        """
+
+        if len(envs) <= 1:
+            return [self.run(cmd, env, timeout_s, cwd) for env in envs]
+
+        batch_env = {**envs[0], "AUTOVRAM_CONFIGS": json.dumps(list(envs))}
+        worker = _Worker(
+            (cmd, str(cwd)),
+            self._popen(cmd, self._base_env | batch_env, cwd),
+            tail_lines=self.tail_lines,
+        )
+
+        outcomes: list[SubprocessOutcome] = []
+        trial_start = time.time()
+        out = _LineBuffer(tail_lines=self.tail_lines, keep=_is_metric_line)
+        timed_out = False
+        while len(outcomes) < len(envs):
+            remaining = trial_start + timeout_s - time.time()
+            if remaining <= 0:
+                timed_out = True
+                break
+            try:
+                line = worker.stdout.get(timeout=remaining)
+            except queue.Empty:
+                timed_out = True
+                break
+            if line is None:
+                break
+            if not _is_marker_line(line):
+                out.add(line)
+                continue
+
+            err = worker.stderr.take_trial(wait_s=2.0)
+            now = time.time()
+            outcomes.append(
+                self._outcome(
+                    out.text(),
+                    err.text(),
+                    exit_code=0,
+                    timed_out=False,
+                    duration_s=now - trial_start,
+                )
+            )
+            trial_start = now
+            out = _LineBuffer(tail_lines=self.tail_lines, keep=_is_metric_line)
+
+        pending = len(outcomes) < len(envs)
+        if timed_out:
+            exit_code = self._terminate(worker.proc, kill_after_s=2.0)
+        else:
+            try:
+                # After the last trial the child only has to tear down.
+                exit_code = worker.proc.wait(timeout=2.0 if pending else timeout_s)
+            except subprocess.TimeoutExpired:
+                exit_code = self._terminate(worker.proc, kill_after_s=2.0)
+        worker.join(timeout_s=2.0)
+
+        if pending:
+            # Whatever is left belongs to the trial that was running at exit.
+            _drain_into(worker.stdout, out, final=True)
+            outcomes.append(
+                self._outcome(
+                    out.text(),
+                    worker.stderr.take_trial(wait_s=0.0).text(),
+                    exit_code=exit_code,
+                    timed_out=timed_out,
+                    duration_s=time.time() - trial_start,
+                )
+            )
+        return outcomes
+
+    @staticmethod
+    def _outcome(
+        stdout: str,
+        stderr: str,
+        *,
+        exit_code: int | None,
+        timed_out: bool,
+        duration_s: float,
+    ) -> SubprocessOutcome:
+        oom = looks_like_oom(stderr)
         return SubprocessOutcome(
-            ok=ok,
+            ok=(not timed_out) and (exit_code == 0) and (not oom),
             exit_code=exit_code,
             timed_out=timed_out,
             oom=oom,
@@ -67,20 +304,260 @@ class SubprocessRunner:
             duration_s=duration_s,
         )
 
-    def _terminate_and_collect(
-        self, proc: subprocess.Popen[str], kill_after_s: float
-    ) -> tuple[str, str]:
-        """Terminate a process group, then kill if needed."""
+    def close(self) -> None:
+        """Release anything kept alive between runs (nothing for one-shot runs)."""
+
+    def _popen(
+        self, cmd: str, env: dict[str, str], cwd: Path, *, stdin: int | None = None
+    ) -> subprocess.Popen[str]:
+        args, spawn_cwd = _spawn_target(cmd, cwd)
+        with _spawn_affinity(self.cpu_pin):
+            return subprocess.Popen(
+                args,
+                cwd=spawn_cwd,
+                env=env,
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
+                text=True,
+                # A stray non-UTF-8 byte must not kill the reader thread.
+                errors="replace",
+            )
+
+    def _terminate(self, proc: subprocess.Popen[str], kill_after_s: float) -> int | None:
+        """Terminate a process, then kill if needed."""
 
         with suppress(Exception):
             proc.send_signal(signal.SIGTERM)
 
         try:
-            return proc.communicate(timeout=kill_after_s)
+            return proc.wait(timeout=kill_after_s)
         except subprocess.TimeoutExpired:
             with suppress(Exception):
                 proc.kill()
             try:
-                return proc.communicate(timeout=kill_after_s)
+                return proc.wait(timeout=kill_after_s)
             except Exception:
-                return ("", "")
+                return proc.returncode
+
+
+def _drain_into(source: queue.Queue[str | None], sink: _LineBuffer, *, final: bool) -> None:
+    """Move queued lines into `sink` until EOF or the queue goes quiet.
+
+    `final` waits a little longer, for a child that has just exited.
+    """
+
+    wait_s = 0.5 if final else 0.05
+    while True:
+        try:
+            line = source.get(timeout=wait_s)
+        except queue.Empty:
+            return
+        if line is None:
+            return
+        sink.add(line)
+
+
+def _pump_lines(stream: IO[str], sink: queue.Queue[str | None]) -> None:
+    with suppress(Exception):
+        for line in stream:
+            sink.put(line)
+    sink.put(None)
+
+
+class _TrialStreamCapture:
+    """Drain a stream split into trials by `TRIAL_DONE_MARKER` lines.
+
+    Lines go straight into the current trial's bounded `_LineBuffer`, so output
+    stays bounded however long a trial runs; a marker line closes that buffer.
+    """
+
+    def __init__(self, stream: IO[str], *, tail_lines: int, keep: Callable[[str], bool]) -> None:
+        self._stream = stream
+        self._tail_lines = tail_lines
+        self._keep = keep
+        self._cond = threading.Condition()
+        self._current = self._new_buffer()
+        self._finished: deque[_LineBuffer] = deque()
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _new_buffer(self) -> _LineBuffer:
+        return _LineBuffer(tail_lines=self._tail_lines, keep=self._keep)
+
+    def _drain(self) -> None:
+        with suppress(Exception):
+            for line in self._stream:
+                with self._cond:
+                    if _is_marker_line(line):
+                        self._finished.append(self._current)
+                        self._current = self._new_buffer()
+                        self._cond.notify_all()
+                    else:
+                        self._current.add(line)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def take_trial(self, *, wait_s: float) -> _LineBuffer:
+        """Return the oldest finished trial, waiting up to `wait_s` for its marker.
+
+        Without one (the child died, timed out or never marks), return whatever
+        has been captured since the last marker.
+        """
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._finished or self._closed, timeout=wait_s)
+            if self._finished:
+                return self._finished.popleft()
+            current, self._current = self._current, self._new_buffer()
+            return current
+
+    def join(self, timeout_s: float) -> None:
+        self._thread.join(timeout_s)
+
+
+class _Worker:
+    """A live child process running several trials, with its output streams.
+
+    stdout is queued line by line so the caller can watch for markers; stderr is
+    captured per trial (see `_TrialStreamCapture`).
+    """
+
+    def __init__(
+        self, key: tuple[str, str], proc: subprocess.Popen[str], *, tail_lines: int
+    ) -> None:
+        assert proc.stdout is not None and proc.stderr is not None
+        self.key = key
+        self.proc = proc
+        self.stdout: queue.Queue[str | None] = queue.Queue()
+        self.stderr = _TrialStreamCapture(proc.stderr, tail_lines=tail_lines, keep=has_oom_hint)
+        self._stdout_thread = threading.Thread(
+            target=_pump_lines, args=(proc.stdout, self.stdout), daemon=True
+        )
+        self._stdout_thread.start()
+
+    def join(self, timeout_s: float) -> None:
+        self._stdout_thread.join(timeout_s)
+        self.stderr.join(timeout_s)
+
+
+class PersistentRunner(SubprocessRunner):
+    """Run trials inside one long-lived child process (`tune --reuse-process`).
+
+    The child is started once with `AUTOVRAM_REUSE=1` and receives each trial's
+    env vars as a JSON object on stdin (see `autovram.runtime.iter_runtime_configs`).
+    It reports the end of a trial by printing `TRIAL_DONE_MARKER` to stderr and
+    then stdout. If the child
+    exits instead (OOM, crash, or a script without reuse support), the trial is
+    judged like a normal one-shot run and a fresh child is started next time.
+    Timed-out trials kill the child.
+
+    Not safe for concurrent trials; use it with `concurrency=1`.
+    """
+
+    def __init__(self, *, tail_lines: int = 2048, cpu_pin: tuple[int, ...] | None = None) -> None:
+        super().__init__(tail_lines=tail_lines, cpu_pin=cpu_pin)
+        self._worker: _Worker | None = None
+
+    def run(self, cmd: str, env: dict[str, str], timeout_s: float, cwd: Path) -> SubprocessOutcome:
+        start = time.time()
+        worker = self._ensure_worker(cmd, env, cwd)
+        assert worker.proc.stdin is not None
+
+        with suppress(OSError, ValueError):
+            worker.proc.stdin.write(json.dumps(env) + "\n")
+            worker.proc.stdin.flush()
+
+        out = _LineBuffer(tail_lines=self.tail_lines, keep=_is_metric_line)
+        deadline = start + timeout_s
+        done = False
+        timed_out = False
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                timed_out = True
+                break
+            try:
+                line = worker.stdout.get(timeout=remaining)
+            except queue.Empty:
+                timed_out = True
+                break
+            if line is None:
+                break
+            if _is_marker_line(line):
+                done = True
+                break
+            out.add(line)
+
+        exit_code: int | None = 0
+        if not done:
+            if timed_out:
+                exit_code = self._terminate(worker.proc, kill_after_s=2.0)
+            else:
+                try:
+                    exit_code = worker.proc.wait(timeout=2.0)
+                except subprocess.TimeoutExpired:
+                    exit_code = self._terminate(worker.proc, kill_after_s=2.0)
+            worker.join(timeout_s=2.0)
+            self._worker = None
+            # Anything still queued on stdout belongs to this (final) trial.
+            _drain_into(worker.stdout, out, final=True)
+
+        # The child marks stderr before stdout, so a finished trial's stderr is
+        # normally complete already.
+        err = worker.stderr.take_trial(wait_s=2.0 if done else 0.0)
+
+        return self._outcome(
+            out.text(),
+            err.text(),
+            exit_code=exit_code,
+            timed_out=timed_out,
+            duration_s=time.time() - start,
+        )
+
+    def run_batch(
+        self, cmd: str, envs: Sequence[dict[str, str]], timeout_s: float, cwd: Path
+    ) -> list[SubprocessOutcome]:
+        """Run trials one by one in the worker, stopping after the first failure.
+
+        The worker already amortizes start-up, so there is nothing to fuse; the
+        CLI rejects `--fuse-growth` together with `--reuse-process`.
+        """
+
+        outcomes: list[SubprocessOutcome] = []
+        for env in envs:
+            outcomes.append(self.run(cmd, env, timeout_s, cwd))
+            if not outcomes[-1].ok:
+                break
+        return outcomes
+
+    def close(self) -> None:
+        """Ask the worker to exit by closing its stdin, then make sure it is gone."""
+
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        with suppress(Exception):
+            assert worker.proc.stdin is not None
+            worker.proc.stdin.close()
+        try:
+            worker.proc.wait(timeout=5.0)
+        except subprocess.TimeoutExpired:
+            self._terminate(worker.proc, kill_after_s=2.0)
+
+    def _ensure_worker(self, cmd: str, env: dict[str, str], cwd: Path) -> _Worker:
+        key = (cmd, str(cwd))
+        if self._worker is not None:
+            if self._worker.key == key and self._worker.proc.poll() is None:
+                return self._worker
+            self.close()
+
+        merged_env = self._base_env | env
+        merged_env["AUTOVRAM_REUSE"] = "1"
+
+        proc = self._popen(cmd, merged_env, cwd, stdin=subprocess.PIPE)
+        self._worker = _Worker(key, proc, tail_lines=self.tail_lines)
+        return self._worker
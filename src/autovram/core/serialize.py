@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import fields, is_dataclass
+from types import UnionType
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+from .types import AutoVRAMConfig
+
+
+def _load_msgspec() -> Any | None:
+    """Optional: C-level JSON encoding straight from dataclass fields."""
+
+    try:
+        import msgspec  # type: ignore
+
+        return msgspec
+    except Exception:
+        return None
+
+
+_msgspec = _load_msgspec()
+
+
+def _plain(obj: Any) -> Any:
+    """Convert to JSON-safe builtins the way msgspec encodes them.
+
+    Dataclasses become dicts, non-finite floats become None and unknown objects
+    (e.g. paths) become strings.
+    """
+
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _plain(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, dict):
+        return {str(k): _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    return str(obj)
+
+
+def to_json(obj: Any) -> str:
+    """Pretty-print dataclasses (possibly nested in dicts/lists) as JSON.
+
+    Paths and other unknown objects are written as strings, and inf/NaN as
+    null. Uses `msgspec` when installed (`pip install 'autovram[msgspec]'`),
+    which avoids the intermediate copy. Both paths produce equivalent JSON, but
+    the text can differ (e.g. float formatting); use `stable_json` for hashing.
+    """
+
+    if _msgspec is not None:
+        encoded = _msgspec.json.encode(obj, enc_hook=str)
+        text: str = _msgspec.json.format(encoded, indent=2).decode("utf-8")
+        return text
+    return json.dumps(_plain(obj), indent=2, ensure_ascii=False, allow_nan=False)
+
+
+def stable_json(obj: Any) -> str:
+    """Compact JSON with sorted keys that does not depend on optional extras."""
+
+    return json.dumps(_plain(obj), sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def _matches(value: Any, tp: Any) -> bool:
+    origin = get_origin(tp)
+    if origin is Literal:
+        return value in get_args(tp)
+    if origin in (Union, UnionType):
+        return any(_matches(value, arg) for arg in get_args(tp))
+    if tp is type(None):
+        return value is None
+    if tp is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if tp is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, tp)
+
+
+def _config_from_dict(raw: Any) -> AutoVRAMConfig:
+    if not isinstance(raw, dict):
+        raise ValueError(f"Expected a JSON object for a config, got {type(raw).__name__}")
+    hints = get_type_hints(AutoVRAMConfig)
+    kwargs: dict[str, Any] = {}
+    for f in fields(AutoVRAMConfig):
+        if f.name not in raw:
+            continue
+        value = raw[f.name]
+        if not _matches(value, hints[f.name]):
+            raise ValueError(f"Invalid value for {f.name!r}: {value!r}")
+        kwargs[f.name] = value
+    return AutoVRAMConfig(**kwargs)
+
+
+def config_from_json(text: str) -> AutoVRAMConfig:
+    """Load an `AutoVRAMConfig` written by `to_json`.
+
+    Unknown keys are ignored; missing keys take their defaults. Raises
+    `ValueError` for malformed JSON or a value of the wrong type (e.g. an
+    unsupported precision).
+    """
+
+    return _config_from_dict(json.loads(text))
+
+
+def configs_from_json(text: str) -> list[AutoVRAMConfig]:
+    """Load a JSON list of configs written by `to_json` (see `config_from_json`)."""
+
+    raw = json.loads(text)
+    if not isinstance(raw, list):
+        raise ValueError(f"Expected a JSON list of configs, got {type(raw).__name__}")
+    return [_config_from_dict(item) for item in raw]
@@ -1,47 +1,91 @@
 from __future__ import annotations
 
-import json
-import time
-from dataclasses import asdict, replace
+import gzip
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields, replace
 from pathlib import Path
 
-from .metric import parse_metric
-from .runner import SubprocessRunner
+from .metric import parse_metrics
+from .runner import SubprocessOutcome, SubprocessRunner
+from .serialize import to_json
 from .types import AutoVRAMConfig, RunContext, RunResult
 
 
-def _timestamp() -> str:
-    return time.strftime("%Y-%m-%d_%H-%M-%S")
+def ensure_run_dir(base: Path) -> Path:
+    """Create the next numbered run directory (`runs/000000`, `runs/000001`, ...).
 
+    The `mkdir` itself is the atomic claim, so concurrent invocations never share
+    a directory; on a collision we simply move on to the next number.
+    """
 
-def ensure_run_dir(base: Path) -> Path:
-    run_dir = base / "runs" / _timestamp()
-    run_dir.mkdir(parents=True, exist_ok=False)
-    return run_dir
+    runs = base / "runs"
+    runs.mkdir(parents=True, exist_ok=True)
+    with os.scandir(runs) as entries:
+        next_id = 1 + max((int(e.name) for e in entries if e.name.isdigit()), default=-1)
+    while True:
+        run_dir = runs / f"{next_id:06d}"
+        try:
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            next_id += 1
+
+
+_LOG_FIELDS = frozenset({"stdout", "stderr"})
+
+# Logs larger than this are written gzip-compressed (`stdout.txt.gz`).
+_GZIP_LOG_THRESHOLD = 64 * 1024
+
+
+def _write_log(path: Path, text: str) -> None:
+    data = text.encode("utf-8")
+    gz_path = path.with_name(path.name + ".gz")
+    # Trial dirs are reused across precisions; never leave the other variant behind.
+    if len(data) > _GZIP_LOG_THRESHOLD:
+        path.unlink(missing_ok=True)
+        gz_path.write_bytes(gzip.compress(data))
+    else:
+        gz_path.unlink(missing_ok=True)
+        path.write_bytes(data)
 
 
 def write_trial_artifacts(trial_dir: Path, result: RunResult) -> None:
     trial_dir.mkdir(parents=True, exist_ok=True)
 
-    (trial_dir / "stdout.txt").write_text(result.stdout, encoding="utf-8")
-    (trial_dir / "stderr.txt").write_text(result.stderr, encoding="utf-8")
+    _write_log(trial_dir / "stdout.txt", result.stdout)
+    _write_log(trial_dir / "stderr.txt", result.stderr)
 
-    payload = {
-        **asdict(result),
-        # Make Paths JSON-friendly
-        "artifacts_dir": str(result.artifacts_dir),
-    }
-    (trial_dir / "result.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Logs are already on disk next to result.json; don't encode them twice.
+    payload = {f.name: getattr(result, f.name) for f in fields(result) if f.name not in _LOG_FIELDS}
+    (trial_dir / "result.json").write_text(to_json(payload), encoding="utf-8")
 
 
-def run_script_trial(
-    *,
-    context: RunContext,
-    runner: SubprocessRunner,
-    cmd: str,
-    config: AutoVRAMConfig,
-    trial_dir: Path,
-) -> RunResult:
+# Fraction of total VRAM the affine memory model may plan to use.
+_VRAM_UTILIZATION = 0.92
+# Relative error above which the memory model is not trusted.
+_VRAM_MODEL_TOLERANCE = 0.15
+
+
+def _fit_vram_model(points: dict[int, float]) -> tuple[float, float] | None:
+    """Fit `vram_mib = a * batch_size + b` through the two largest observed batch sizes."""
+
+    if len(points) < 2:
+        return None
+    (bs0, m0), (bs1, m1) = sorted(points.items())[-2:]
+    a = (m1 - m0) / (bs1 - bs0)
+    if a <= 0:
+        return None
+    return a, m1 - a * bs1
+
+
+def _predict_max_batch(model: tuple[float, float], vram_total_mib: float) -> int:
+    a, b = model
+    return int((vram_total_mib * _VRAM_UTILIZATION - b) // a)
+
+
+def _trial_env(config: AutoVRAMConfig, extra_env: dict[str, str] | None) -> dict[str, str]:
     env = {
         "AUTOVRAM_BATCH_SIZE": str(config.batch_size),
         "AUTOVRAM_MICRO_BATCH": str(config.micro_batch or config.batch_size),
@@ -52,10 +96,22 @@ def run_script_trial(
     if config.seq_len is not None:
         env["AUTOVRAM_SEQ_LEN"] = str(config.seq_len)
 
-    outcome = runner.run(cmd=cmd, env=env, timeout_s=context.timeout_s, cwd=context.exec_cwd)
-    metric_val = parse_metric(outcome.stdout, context.metric_name)
+    if config.compile_mode is not None:
+        env["AUTOVRAM_COMPILE_MODE"] = config.compile_mode
+
+    if extra_env:
+        env.update(extra_env)
+    return env
+
+
+def _result_from_outcome(
+    context: RunContext, config: AutoVRAMConfig, outcome: SubprocessOutcome, trial_dir: Path
+) -> RunResult:
+    metrics = parse_metrics(outcome.stdout)
+    metric_val = metrics.get(context.metric_name)
+    vram_mib = metrics.get("vram_mib")
 
-    result = RunResult(
+    return RunResult(
         config=config,
         ok=outcome.ok and (metric_val is not None),
         exit_code=outcome.exit_code,
@@ -67,12 +123,77 @@ def run_script_trial(
         duration_s=outcome.duration_s,
         artifacts_dir=trial_dir,
         notes=[] if metric_val is not None else ["Metric not found in stdout"],
+        vram_mib=vram_mib,
     )
 
-    write_trial_artifacts(trial_dir, result)
+
+def run_script_trial(
+    *,
+    context: RunContext,
+    runner: SubprocessRunner,
+    cmd: str,
+    config: AutoVRAMConfig,
+    trial_dir: Path,
+    extra_env: dict[str, str] | None = None,
+    write_artifacts: Callable[[Path, RunResult], None] = write_trial_artifacts,
+) -> RunResult:
+    env = _trial_env(config, extra_env)
+    outcome = runner.run(cmd=cmd, env=env, timeout_s=context.timeout_s, cwd=context.exec_cwd)
+    result = _result_from_outcome(context, config, outcome, trial_dir)
+
+    write_artifacts(trial_dir, result)
     return result
 
 
+def run_script_trials_fused(
+    *,
+    context: RunContext,
+    runner: SubprocessRunner,
+    cmd: str,
+    configs: Sequence[AutoVRAMConfig],
+    trial_dirs: Sequence[Path],
+    extra_env: dict[str, str] | None = None,
+    write_artifacts: Callable[[Path, RunResult], None] = write_trial_artifacts,
+) -> list[RunResult]:
+    """Run `configs` in order inside a single child process (`runner.run_batch`).
+
+    Returns one result per trial the child reached, which may be fewer than
+    `configs` if it stopped early (e.g. on OOM).
+    """
+
+    envs = [_trial_env(config, extra_env) for config in configs]
+    outcomes = runner.run_batch(
+        cmd=cmd, envs=envs, timeout_s=context.timeout_s, cwd=context.exec_cwd
+    )
+
+    results: list[RunResult] = []
+    for config, trial_dir, outcome in zip(configs, trial_dirs, outcomes, strict=False):
+        result = _result_from_outcome(context, config, outcome, trial_dir)
+        write_artifacts(trial_dir, result)
+        results.append(result)
+    return results
+
+
+class _BackgroundArtifactWriter:
+    """Write trial artifacts on a single background thread.
+
+    The next trial can start while the previous one's logs are still being
+    written. `close` waits for all writes and re-raises the first failure.
+    """
+
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autovram-artifacts")
+        self._pending: list[Future[None]] = []
+
+    def __call__(self, trial_dir: Path, result: RunResult) -> None:
+        self._pending.append(self._pool.submit(write_trial_artifacts, trial_dir, result))
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        for f in self._pending:
+            f.result()
+
+
 def autotune_batch_size(
     *,
     context: RunContext,
@@ -81,25 +202,100 @@ def autotune_batch_size(
     base_config: AutoVRAMConfig,
     min_bs: int = 1,
     max_trials: int = 25,
+    concurrency: int = 1,
+    devices: Sequence[str] | None = None,
+    plateau_ratio: float | None = 1.05,
+    fuse_growth: int = 1,
 ) -> tuple[AutoVRAMConfig | None, list[RunResult]]:
     """Tune batch size using exponential growth + binary search.
 
     The tuning objective is to maximize the metric value among stable runs.
+
+    With `concurrency > 1`, the exponential-growth phase speculatively runs the
+    next `concurrency` batch sizes at once. If `devices` is given (at least
+    `concurrency` of them), every trial is pinned to one of them via
+    `CUDA_VISIBLE_DEVICES`, so concurrent trials never share a device;
+    otherwise trials inherit the parent's visible devices.
+    The binary-search phase is always sequential.
+
+    If trials report peak memory (`AUTOVRAM_METRIC vram_mib=...`) and the total
+    VRAM is known, two good trials are used to fit an affine memory model. The
+    tuner then jumps straight to the predicted largest batch size and probes one
+    step above it. If the prediction holds, no binary search is needed. If not,
+    the search carries on as usual from whatever the jump established.
+
+    Growth also stops early once the metric has plateaued: if two successive
+    doublings each improve it by less than `plateau_ratio`, the best trial so far
+    wins without a binary search. Pass `plateau_ratio=None` to disable this.
+
+    With `fuse_growth > 1`, the growth phase instead runs the next `fuse_growth`
+    batch sizes one after another in a single child process (see
+    `SubprocessRunner.run_batch`), which stops at the first failing size. This
+    cannot be combined with `concurrency > 1`.
     """
 
+    if concurrency > 1 and fuse_growth > 1:
+        raise ValueError("concurrency and fuse_growth cannot both be greater than 1")
+    if devices and concurrency > len(devices):
+        raise ValueError("concurrency must not exceed the number of devices")
+
+    writer = _BackgroundArtifactWriter()
+    try:
+        return _autotune_batch_size(
+            context=context,
+            runner=runner,
+            cmd=cmd,
+            base_config=base_config,
+            min_bs=min_bs,
+            max_trials=max_trials,
+            concurrency=concurrency,
+            devices=devices,
+            plateau_ratio=plateau_ratio,
+            fuse_growth=fuse_growth,
+            write_artifacts=writer,
+        )
+    finally:
+        writer.close()
+
+
+def _autotune_batch_size(
+    *,
+    context: RunContext,
+    runner: SubprocessRunner,
+    cmd: str,
+    base_config: AutoVRAMConfig,
+    min_bs: int,
+    max_trials: int,
+    concurrency: int,
+    devices: Sequence[str] | None,
+    plateau_ratio: float | None,
+    fuse_growth: int,
+    write_artifacts: Callable[[Path, RunResult], None],
+) -> tuple[AutoVRAMConfig | None, list[RunResult]]:
     results: list[RunResult] = []
 
     best: RunResult | None = None
 
-    def trial(cfg: AutoVRAMConfig, idx: int) -> RunResult:
-        trial_dir = context.work_dir / "trials" / f"trial_{idx:03d}"
-        rr = run_script_trial(
+    def trial_dir_for(idx: int) -> Path:
+        return context.work_dir / "trials" / f"trial_{idx:03d}"
+
+    def extra_env_for(slot: int) -> dict[str, str] | None:
+        return {"CUDA_VISIBLE_DEVICES": devices[slot % len(devices)]} if devices else None
+
+    def run_trial(cfg: AutoVRAMConfig, idx: int, slot: int = 0) -> RunResult:
+        trial_dir = trial_dir_for(idx)
+        extra_env = extra_env_for(slot)
+        return run_script_trial(
             context=context,
             runner=runner,
             cmd=cmd,
             config=cfg,
             trial_dir=trial_dir,
+            extra_env=extra_env,
+            write_artifacts=write_artifacts,
         )
+
+    def record(rr: RunResult) -> RunResult:
         results.append(rr)
         nonlocal best
         if (
@@ -110,29 +306,120 @@ def autotune_batch_size(
             best = rr
         return rr
 
+    def config_for(bs: int) -> AutoVRAMConfig:
+        return replace(base_config, batch_size=bs, micro_batch=bs)
+
     # Phase 1: exponential growth until first bad
     last_good_bs: int | None = None
     first_bad_bs: int | None = None
 
+    vram_total = context.system.vram_total_mib
+    vram_points: dict[int, float] = {}
+    model_tried = False
+    model_settled = False
+
+    prev_metric: float | None = None
+    flat_doublings = 0
+    plateaued = False
+
     bs = max(min_bs, 1)
     i = 1
-    while i <= max_trials:
-        cfg = replace(base_config, batch_size=bs, micro_batch=bs)
-        rr = trial(cfg, i)
-        if rr.ok:
-            last_good_bs = bs
-            bs *= 2
+    width = max(concurrency, fuse_growth, 1)
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        while i <= max_trials and first_bad_bs is None:
+            sizes = [bs << k for k in range(min(width, max_trials - i + 1))]
+            if len(sizes) == 1:
+                batch = [run_trial(config_for(sizes[0]), i)]
+            elif fuse_growth > 1:
+                batch = run_script_trials_fused(
+                    context=context,
+                    runner=runner,
+                    cmd=cmd,
+                    configs=[config_for(b) for b in sizes],
+                    trial_dirs=[trial_dir_for(i + k) for k in range(len(sizes))],
+                    extra_env=extra_env_for(0),
+                    write_artifacts=write_artifacts,
+                )
+                # The child may stop early; sizes it never reached are retried later.
+                sizes = sizes[: len(batch)]
+            else:
+                futures = [
+                    pool.submit(run_trial, config_for(b), i + k, k) for k, b in enumerate(sizes)
+                ]
+                batch = [f.result() for f in futures]
+            i += len(sizes)
+
+            for b, rr in zip(sizes, batch, strict=True):
+                record(rr)
+                if first_bad_bs is not None or plateaued:
+                    continue
+                if rr.ok:
+                    last_good_bs = b
+                    if rr.vram_mib is not None:
+                        vram_points[b] = rr.vram_mib
+                    if plateau_ratio is not None and rr.metric_value is not None:
+                        flat = (
+                            prev_metric is not None
+                            and rr.metric_value < plateau_ratio * prev_metric
+                        )
+                        flat_doublings = flat_doublings + 1 if flat else 0
+                        prev_metric = rr.metric_value
+                        plateaued = flat_doublings >= 2
+                else:
+                    first_bad_bs = b
+            bs = sizes[-1] * 2
+
+            if plateaued:
+                break
+
+            if first_bad_bs is not None or model_tried or vram_total is None:
+                continue
+            model = _fit_vram_model(vram_points)
+            if model is None:
+                continue
+            model_tried = True
+            predicted = _predict_max_batch(model, vram_total)
+            # Only jump if it saves at least one doubling.
+            if predicted <= bs or i > max_trials:
+                continue
+
+            rr = record(run_trial(config_for(predicted), i))
+            i += 1
+            # The jump is not a doubling; restart plateau tracking from here.
+            prev_metric, flat_doublings = None, 0
+            if not rr.ok:
+                first_bad_bs = predicted
+                continue
+            last_good_bs = predicted
+            bs = predicted * 2
+
+            expected = model[0] * predicted + model[1]
+            if (
+                rr.vram_mib is None
+                or abs(rr.vram_mib - expected) > _VRAM_MODEL_TOLERANCE * expected
+            ):
+                continue
+            if i > max_trials:
+                break
+
+            edge = predicted + max(1, predicted // 16)
+            rr = record(run_trial(config_for(edge), i))
             i += 1
-            continue
-        first_bad_bs = bs
-        break
+            if rr.ok:
+                last_good_bs = edge
+                bs = edge * 2
+            else:
+                first_bad_bs = edge
+                model_settled = True
 
     # If we never found a good config, return None.
     if last_good_bs is None:
         return None, results
 
     # If we never found a bad config, we already tried max_trials.
-    if first_bad_bs is None:
+    # If the memory model's edge probe failed as predicted, or throughput has
+    # plateaued, there is nothing worth bisecting.
+    if first_bad_bs is None or model_settled or plateaued:
         return best.config if best else None, results
 
     # Phase 2: binary search between last_good and first_bad
@@ -140,8 +427,7 @@ def autotune_batch_size(
     hi = first_bad_bs
     while i <= max_trials and (hi - lo) > 1:
         mid = (lo + hi) // 2
-        cfg = replace(base_config, batch_size=mid, micro_batch=mid)
-        rr = trial(cfg, i)
+        rr = record(run_trial(config_for(mid), i))
         if rr.ok:
             lo = mid
         else:
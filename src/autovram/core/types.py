@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -7,7 +8,7 @@ from typing import Any, Literal
 Precision = Literal["fp32", "fp16", "bf16"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemInfo:
     os: str
     arch: str
@@ -19,7 +20,7 @@ class SystemInfo:
     extra: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AutoVRAMConfig:
     """Common tuning knobs for script mode and vLLM mode.
 
@@ -32,6 +33,7 @@ class AutoVRAMConfig:
     grad_accum: int = 1
     precision: Precision = "fp16"
     seq_len: int | None = None
+    compile_mode: str | None = None
 
     # vLLM mode
     dtype: str | None = None
@@ -40,8 +42,12 @@ class AutoVRAMConfig:
     max_num_seqs: int | None = None
     quantization: str | None = None
 
+    def __post_init__(self) -> None:
+        # Precision comes from env vars / JSON as fresh strings; share one object per value.
+        object.__setattr__(self, "precision", sys.intern(self.precision))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RunContext:
     mode: Literal["script", "vllm"]
     system: SystemInfo
@@ -52,7 +58,7 @@ class RunContext:
     engine_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     config: AutoVRAMConfig
     ok: bool
@@ -65,3 +71,4 @@ class RunResult:
     duration_s: float
     artifacts_dir: Path
     notes: list[str] = field(default_factory=list)
+    vram_mib: float | None = None
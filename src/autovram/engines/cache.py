@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from contextlib import suppress
+from pathlib import Path
+
+from autovram import __version__
+from autovram.core.serialize import configs_from_json, stable_json, to_json
+from autovram.core.types import AutoVRAMConfig, SystemInfo
+
+from .base import Engine, EngineContext
+
+PROPOSALS_MAX_AGE_S = 24 * 60 * 60
+
+
+def system_fingerprint(system: SystemInfo) -> str:
+    """Short stable hash of the detected system (includes torch version and GPU)."""
+
+    return hashlib.blake2b(stable_json(system).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _engine_settings(engine: Engine) -> dict[str, str]:
+    # Constructor options such as `HeuristicEngine(precisions=...)` change the proposals.
+    return {k: repr(v) for k, v in sorted(getattr(engine, "__dict__", {}).items())}
+
+
+def _proposals_key(engine: Engine, system: SystemInfo) -> str:
+    payload = {
+        "autovram": __version__,
+        "engine": f"{type(engine).__module__}.{type(engine).__qualname__}",
+        "settings": _engine_settings(engine),
+        "system": system_fingerprint(system),
+    }
+    return hashlib.blake2b(stable_json(payload).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def cached_propose_configs(
+    engine: Engine,
+    context: EngineContext,
+    cache_dir: Path,
+    *,
+    max_age_s: float = PROPOSALS_MAX_AGE_S,
+) -> list[AutoVRAMConfig]:
+    """Return `engine.propose_configs(context)`, reusing a recent result from `cache_dir`.
+
+    Entries are keyed by engine (class and settings), autovram version and system
+    fingerprint, so an upgrade or a changed GPU or torch install yields fresh
+    proposals. Empty results are not cached. Cache I/O errors are never fatal.
+    """
+
+    path = cache_dir / f"{engine.name}_{_proposals_key(engine, context.run.system)}.json"
+
+    with suppress(Exception):
+        if time.time() - path.stat().st_mtime < max_age_s:
+            return configs_from_json(path.read_text(encoding="utf-8"))
+
+    configs = list(engine.propose_configs(context))
+    if not configs:
+        return configs
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(to_json(configs), encoding="utf-8")
+    return configs
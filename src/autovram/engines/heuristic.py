@@ -3,26 +3,42 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import replace
 
-from autovram.core.types import AutoVRAMConfig, RunResult
+from autovram.core.types import AutoVRAMConfig, RunResult, SystemInfo
 
 from .base import Engine, EngineContext
 
 
+def _cuda_capability(system: SystemInfo) -> tuple[int, int]:
+    try:
+        major, minor = str(system.extra.get("cuda_cc", "0.0")).split(".", 1)
+        return int(major), int(minor)
+    except ValueError:
+        return (0, 0)
+
+
+def _default_precisions(system: SystemInfo) -> tuple[str, ...]:
+    if system.compute == "CUDA" and _cuda_capability(system) >= (8, 0):
+        return ("bf16", "fp16", "fp32")
+    return ("fp16", "bf16", "fp32")
+
+
 class HeuristicEngine:
     """Simple, dependency-free engine.
 
     This engine proposes a small set of precisions and expects the core
-    to run a batch-size search.
+    to run a batch-size search. Unless `precisions` is given, bf16 is tried
+    first on CUDA GPUs with compute capability >= 8.0 (Ampere+), fp16 otherwise.
     """
 
     name = "heuristic"
 
-    def __init__(self, *, precisions: tuple[str, ...] = ("fp16", "bf16", "fp32")):
+    def __init__(self, *, precisions: tuple[str, ...] | None = None):
         self._precisions = precisions
 
     def propose_configs(self, context: EngineContext) -> Iterable[AutoVRAMConfig]:
         base = AutoVRAMConfig(batch_size=1, micro_batch=1)
-        for p in self._precisions:
+        precisions = self._precisions or _default_precisions(context.run.system)
+        for p in precisions:
             yield replace(base, precision=p)  # type: ignore[arg-type]
 
     def score_result(self, result: RunResult) -> float:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import asdict
 from pathlib import Path
 from typing import Literal
 
+from autovram.core.serialize import to_json
 from autovram.core.types import AutoVRAMConfig
 
 ExportFormat = Literal["json", "yaml", "dotenv"]
@@ -14,7 +14,7 @@ def export_config(config: AutoVRAMConfig, *, fmt: ExportFormat, out_path: Path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     if fmt == "json":
-        out_path.write_text(json.dumps(asdict(config), indent=2) + "\n", encoding="utf-8")
+        out_path.write_text(to_json(config) + "\n", encoding="utf-8")
         return
 
     if fmt == "dotenv":
@@ -4,6 +4,6 @@ In script mode, autovram communicates via environment variables.
 This module provides a small, stable API to read them.
 """
 
-from .runtime import RuntimeConfig, get_runtime_config, print_metric
+from .runtime import RuntimeConfig, get_runtime_config, iter_runtime_configs, print_metric
 
-__all__ = ["RuntimeConfig", "get_runtime_config", "print_metric"]
+__all__ = ["RuntimeConfig", "get_runtime_config", "iter_runtime_configs", "print_metric"]
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import json
 import os
+import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 Precision = Literal["fp32", "fp16", "bf16"]
 
+# Printed by a reuse-mode child after each trial; see `iter_runtime_configs`.
+TRIAL_DONE_MARKER = "AUTOVRAM_TRIAL_DONE"
+
 
 @dataclass(frozen=True)
 class RuntimeConfig:
@@ -14,6 +20,7 @@ class RuntimeConfig:
     grad_accum: int
     precision: Precision
     seq_len: int | None
+    compile_mode: str | None = None
 
 
 def _get_int(name: str, default: int) -> int:
@@ -36,6 +43,7 @@ def get_runtime_config() -> RuntimeConfig:
     - AUTOVRAM_GRAD_ACCUM
     - AUTOVRAM_PRECISION (fp32|fp16|bf16)
     - AUTOVRAM_SEQ_LEN
+    - AUTOVRAM_COMPILE_MODE (a `torch.compile` mode, e.g. reduce-overhead)
     """
 
     bs = _get_int("AUTOVRAM_BATCH_SIZE", 1)
@@ -56,11 +64,78 @@ def get_runtime_config() -> RuntimeConfig:
         except ValueError:
             seq_len = None
 
+    compile_mode = os.environ.get("AUTOVRAM_COMPILE_MODE", "").strip() or None
+
     return RuntimeConfig(
-        batch_size=bs, micro_batch=mb, grad_accum=ga, precision=precision, seq_len=seq_len
+        batch_size=bs,
+        micro_batch=mb,
+        grad_accum=ga,
+        precision=precision,
+        seq_len=seq_len,
+        compile_mode=compile_mode,
     )
 
 
+def _stdin_updates() -> Iterator[dict[str, Any]]:
+    for raw in sys.stdin:
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            updates = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(updates, dict):
+            yield updates
+
+
+def _apply_env_updates(updates: dict[str, Any]) -> None:
+    for k, v in updates.items():
+        if v is None:
+            os.environ.pop(str(k), None)
+        else:
+            os.environ[str(k)] = str(v)
+
+
+def iter_runtime_configs() -> Iterator[RuntimeConfig]:
+    """Yield one config per trial this process should run.
+
+    Normally this yields `get_runtime_config()` once. autovram can also run
+    several trials in one process, in which case each yielded config is one
+    trial and the end of each trial is signalled once the loop body returns:
+
+    - `--reuse-process` (env `AUTOVRAM_REUSE=1`): one JSON object of env var
+      updates per line on stdin.
+    - fused growth (env `AUTOVRAM_CONFIGS`): a JSON array of such objects.
+
+    Example:
+        for cfg in iter_runtime_configs():
+            print_metric(it_per_s=train(cfg))
+    """
+
+    batch_raw = os.environ.get("AUTOVRAM_CONFIGS")
+    if batch_raw:
+        try:
+            batch = [u for u in json.loads(batch_raw) if isinstance(u, dict)]
+        except (TypeError, ValueError):
+            batch = []
+        updates_iter: Iterable[dict[str, Any]] = batch
+    elif os.environ.get("AUTOVRAM_REUSE"):
+        updates_iter = _stdin_updates()
+    else:
+        yield get_runtime_config()
+        return
+
+    for updates in updates_iter:
+        _apply_env_updates(updates)
+
+        yield get_runtime_config()
+
+        # Mark stderr first so the runner can split it per trial, then stdout.
+        print(TRIAL_DONE_MARKER, file=sys.stderr, flush=True)
+        print(TRIAL_DONE_MARKER, flush=True)
+
+
 def print_metric(**metrics: float) -> None:
     """Print metrics in a format autovram can parse.
 
@@ -71,5 +146,5 @@ def print_metric(**metrics: float) -> None:
         AUTOVRAM_METRIC it_per_s=12.3
     """
 
-    for k, v in metrics.items():
-        print(f"AUTOVRAM_METRIC {k}={float(v)}")
+    # One write for all metrics keeps them together on an unbuffered/shared stdout.
+    sys.stdout.write("".join(f"AUTOVRAM_METRIC {k}={float(v)}\n" for k, v in metrics.items()))
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autovram.core import detect
+
+
+@pytest.fixture(autouse=True)
+def _isolated_system_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep `detect_system_cached` away from the real ~/.autovram.
+    monkeypatch.setattr(detect, "_system_cache_path", lambda: tmp_path / "system.json")
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
+import pytest
 from typer.testing import CliRunner
 
-from autovram.cli.app import app
+from autovram.cli.app import _visible_devices, app
+from autovram.core.detect import detect_system
 
 
 def test_cli_info() -> None:
@@ -17,3 +22,54 @@ def test_cli_doctor() -> None:
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 0
     assert "system summary" in result.stdout.lower()
+
+
+def test_cli_tune_rejects_concurrency_on_one_device(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "2")
+    runner = CliRunner()
+    result = runner.invoke(app, ["tune", "--cmd", "true", "--concurrency", "2"])
+    assert result.exit_code == 2
+    assert "one gpu per trial" in result.stdout.lower()
+
+
+def test_cli_tune_rejects_concurrency_above_device_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0,1")
+    result = CliRunner().invoke(app, ["tune", "--cmd", "true", "--concurrency", "4"])
+    assert result.exit_code == 2
+    assert "(2 visible)" in result.stdout
+
+
+def test_visible_devices_respects_parent_mask(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "2, 3")
+    assert _visible_devices(detect_system()) == ["2", "3"]
+
+
+def test_cli_export_reports_invalid_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".autovram").mkdir()
+    (tmp_path / ".autovram" / "config.json").write_text('{"precision": "int8"}', encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["export", "--format", "dotenv", "--out", "out.env"])
+    assert result.exit_code == 2
+    assert "invalid config" in result.stdout.lower()
+
+
+def test_cli_tune_rejects_fuse_growth_with_reuse_process() -> None:
+    result = CliRunner().invoke(
+        app, ["tune", "--cmd", "true", "--reuse-process", "--fuse-growth", "4"]
+    )
+    assert result.exit_code == 2
+    assert "--fuse-growth" in result.stdout
+
+
+def test_cli_info_refresh_bypasses_cache(tmp_path: Path) -> None:
+    runner = CliRunner()
+    assert runner.invoke(app, ["info", "--json"]).exit_code == 0
+
+    cache = tmp_path / "system.json"
+    raw = json.loads(cache.read_text(encoding="utf-8"))
+    raw["system"]["gpu_name"] = "Stale GPU"
+    cache.write_text(json.dumps(raw), encoding="utf-8")
+
+    assert "Stale GPU" in runner.invoke(app, ["info", "--json"]).stdout
+    assert "Stale GPU" not in runner.invoke(app, ["info", "--json", "--refresh"]).stdout
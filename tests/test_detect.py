@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autovram.core import detect
+from autovram.core.types import SystemInfo
+
+
+def test_detect_system_cached_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tmp_path / "system.json"
+    monkeypatch.setattr(detect, "_system_cache_path", lambda: cache)
+
+    first = detect.detect_system_cached()
+    assert cache.exists()
+
+    def _fail() -> SystemInfo:
+        raise AssertionError("cache should have been used")
+
+    monkeypatch.setattr(detect, "detect_system", _fail)
+    assert detect.detect_system_cached() == first
+
+    with pytest.raises(AssertionError):
+        detect.detect_system_cached(force=True)
+
+
+def test_detect_system_cached_invalidated_on_key_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = tmp_path / "system.json"
+    monkeypatch.setattr(detect, "_system_cache_path", lambda: cache)
+    detect.detect_system_cached()
+
+    monkeypatch.setattr(detect, "_system_cache_key", lambda: {"hostname": "elsewhere"})
+    calls: list[int] = []
+    real = detect.detect_system
+
+    def _counting() -> SystemInfo:
+        calls.append(1)
+        return real()
+
+    monkeypatch.setattr(detect, "detect_system", _counting)
+    detect.detect_system_cached()
+    assert calls == [1]
+
+
+def test_system_cache_key_tracks_device_mask(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
+    key = detect._system_cache_key()
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "1,2")
+    assert detect._system_cache_key() != key
+
+
+def test_parse_cpulist() -> None:
+    assert detect.parse_cpulist("0-3,8,10-11\n") == (0, 1, 2, 3, 8, 10, 11)
+    assert detect.parse_cpulist("") == ()
+
+
+def test_system_summary_sorts_extra() -> None:
+    system = SystemInfo(
+        os="Linux",
+        arch="x86_64",
+        python="3.11.0",
+        torch_version=None,
+        compute="CPU",
+        gpu_name=None,
+        vram_total_mib=None,
+        extra={"b": 2, "a": 1},
+    )
+    assert detect.system_summary_lines(system) == [
+        "System summary",
+        "──────────────",
+        "OS: Linux (x86_64)",
+        "Python: 3.11.0",
+        "PyTorch: not installed",
+        "Compute: CPU",
+        "a: 1",
+        "b: 2",
+    ]
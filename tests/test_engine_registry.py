@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+
 import pytest
 
+from autovram.core.detect import detect_system
+from autovram.core.types import AutoVRAMConfig, RunContext, RunResult, SystemInfo
+from autovram.engines.base import EngineContext
+from autovram.engines.cache import cached_propose_configs
 from autovram.engines.registry import resolve_engine
 
 
@@ -15,3 +23,105 @@ def test_llm_autobatch_missing_dependency_message() -> None:
     with pytest.raises(RuntimeError) as ei:
         resolve_engine("llm-autobatch")
     assert "Install" in str(ei.value)
+
+
+def test_heuristic_prefers_bf16_on_ampere(tmp_path: Path) -> None:
+    def first_precision(system: SystemInfo) -> str:
+        ctx = RunContext(
+            mode="script",
+            system=system,
+            metric_name="it_per_s",
+            timeout_s=1.0,
+            work_dir=tmp_path,
+            exec_cwd=tmp_path,
+            engine_name="heuristic",
+        )
+        return next(
+            iter(resolve_engine("heuristic").propose_configs(EngineContext(run=ctx)))
+        ).precision
+
+    cuda = SystemInfo(
+        os="Linux",
+        arch="x86_64",
+        python="3.11.0",
+        torch_version="2.4.0",
+        compute="CUDA",
+        gpu_name="GPU",
+        vram_total_mib=24_000,
+    )
+    assert first_precision(replace(cuda, extra={"cuda_cc": "8.6"})) == "bf16"
+    assert first_precision(replace(cuda, extra={"cuda_cc": "7.5"})) == "fp16"
+    assert first_precision(replace(cuda, compute="CPU")) == "fp16"
+
+
+def test_proposals_are_cached_per_system(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    class CountingEngine:
+        name = "counting"
+
+        def propose_configs(self, context: EngineContext) -> Iterable[AutoVRAMConfig]:
+            calls.append(1)
+            return [AutoVRAMConfig(batch_size=2, micro_batch=2, precision="bf16")]
+
+        def score_result(self, result: RunResult) -> float:
+            return 0.0
+
+    system = SystemInfo(
+        os="Linux",
+        arch="x86_64",
+        python="3.11.0",
+        torch_version="2.4.0",
+        compute="CPU",
+        gpu_name=None,
+        vram_total_mib=None,
+    )
+    ctx = RunContext(
+        mode="script",
+        system=system,
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="counting",
+    )
+    eng = CountingEngine()
+    cache_dir = tmp_path / "proposals"
+
+    first = cached_propose_configs(eng, EngineContext(run=ctx), cache_dir)
+    second = cached_propose_configs(eng, EngineContext(run=ctx), cache_dir)
+    assert first == second == [AutoVRAMConfig(batch_size=2, micro_batch=2, precision="bf16")]
+    assert calls == [1]
+
+    other = EngineContext(run=replace(ctx, system=replace(system, torch_version="2.5.0")))
+    cached_propose_configs(eng, other, cache_dir)
+    assert calls == [1, 1]
+
+    # Different engine settings must not share cached proposals.
+    eng.mode = "other"  # type: ignore[attr-defined]
+    cached_propose_configs(eng, EngineContext(run=ctx), cache_dir)
+    assert calls == [1, 1, 1]
+
+
+def test_empty_proposals_are_not_cached(tmp_path: Path) -> None:
+    class EmptyEngine:
+        name = "empty"
+
+        def propose_configs(self, context: EngineContext) -> Iterable[AutoVRAMConfig]:
+            return []
+
+        def score_result(self, result: RunResult) -> float:
+            return 0.0
+
+    ctx = RunContext(
+        mode="script",
+        system=detect_system(),
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="empty",
+    )
+    cache_dir = tmp_path / "proposals"
+    assert cached_propose_configs(EmptyEngine(), EngineContext(run=ctx), cache_dir) == []
+    assert not cache_dir.exists()
@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from autovram.core import serialize
 from autovram.core.types import AutoVRAMConfig
 from autovram.io.export import export_config
 
@@ -25,3 +28,39 @@ def test_export_dotenv(tmp_path: Path) -> None:
     text = out.read_text(encoding="utf-8")
     assert "AUTOVRAM_BATCH_SIZE=2" in text
     assert "AUTOVRAM_PRECISION=fp16" in text
+
+
+def test_json_roundtrip_with_and_without_msgspec(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = AutoVRAMConfig(batch_size=4, micro_batch=2, precision="bf16", compile_mode="default")
+    payload = {
+        "config": cfg,
+        "artifacts_dir": tmp_path,
+        "gpu_name": "Gé",
+        "floats": [1e-7, 1e16, 0.1, float("inf"), float("nan")],
+    }
+
+    fast = serialize.to_json(payload)
+    fast_key = serialize.stable_json(payload)
+    assert serialize.config_from_json(serialize.to_json(cfg)) == cfg
+
+    monkeypatch.setattr(serialize, "_msgspec", None)
+    slow = serialize.to_json(payload)
+    assert json.loads(slow) == json.loads(fast)
+    assert "Infinity" not in slow and "NaN" not in slow
+    assert "Gé" in slow
+    assert serialize.stable_json(payload) == fast_key
+    assert serialize.config_from_json(serialize.to_json(cfg)) == cfg
+    assert json.loads(fast)["artifacts_dir"] == str(tmp_path)
+    assert json.loads(fast)["floats"] == [1e-7, 1e16, 0.1, None, None]
+
+
+def test_config_from_json_ignores_unknown_keys_and_validates() -> None:
+    cfg = serialize.config_from_json('{"batch_size": 8, "precision": "bf16", "future": 1}')
+    assert cfg == AutoVRAMConfig(batch_size=8, precision="bf16")
+
+    with pytest.raises(ValueError, match="batch_size"):
+        serialize.config_from_json('{"batch_size": "2"}')
+    with pytest.raises(ValueError, match="precision"):
+        serialize.config_from_json('{"precision": "int8"}')
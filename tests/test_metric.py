@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from autovram.core.metric import parse_metric, parse_metrics
+
+
+def test_parse_metric_returns_last_value() -> None:
+    stdout = (
+        "epoch 1\n"
+        "AUTOVRAM_METRIC it_per_s=1.5\n"
+        "AUTOVRAM_METRIC loss=0.25\n"
+        "  AUTOVRAM_METRIC it_per_s=2.5  \r\n"
+        "done\n"
+    )
+    assert parse_metric(stdout, "it_per_s") == 2.5
+    assert parse_metric(stdout, "loss") == 0.25
+
+
+def test_parse_metric_ignores_malformed_lines() -> None:
+    stdout = "AUTOVRAM_METRIC it_per_s=1.2.3\nprefix AUTOVRAM_METRIC it_per_s=9\n"
+    assert parse_metric(stdout, "it_per_s") is None
+    assert parse_metric("", "it_per_s") is None
+
+
+def test_parse_metrics_single_pass() -> None:
+    stdout = (
+        "AUTOVRAM_METRIC it_per_s=1.0\nAUTOVRAM_METRIC vram_mib=512\nAUTOVRAM_METRIC it_per_s=3\n"
+    )
+    assert parse_metrics(stdout) == {"it_per_s": 3.0, "vram_mib": 512.0}
+    assert parse_metrics("no metrics here") == {}
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from autovram.core import oom
+from autovram.core.oom import looks_like_oom
+
+_CASES = [
+    "RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB",
+    "RuntimeError: CUBLAS_STATUS_ALLOC_FAILED when calling cublasCreate",
+    "cuBLAS failed to alloc workspace",
+    "hipErrorOutOfMemory",
+    "MPS backend out of memory",
+]
+_NON_OOM = [
+    "Traceback (most recent call last):\nValueError: bad input\n",
+    "cuBLAS warning: falling back to default workspace\nalloc ok",
+]
+
+
+@pytest.mark.parametrize("stderr", _CASES)
+def test_looks_like_oom_detects_known_patterns(stderr: str) -> None:
+    assert looks_like_oom(stderr)
+
+
+def test_looks_like_oom_ignores_other_errors() -> None:
+    for stderr in _NON_OOM:
+        assert not looks_like_oom(stderr)
+
+
+def test_regex_and_automaton_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    if oom._OOM_AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+
+    with_automaton = [looks_like_oom(s) for s in _CASES + _NON_OOM]
+    monkeypatch.setattr(oom, "_OOM_AUTOMATON", None)
+    assert [looks_like_oom(s) for s in _CASES + _NON_OOM] == with_automaton
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from autovram.core.metric import parse_metric
+from autovram.core.runner import PersistentRunner, SubprocessRunner, _spawn_target
+
+
+def _py(code: str) -> str:
+    return f'"{sys.executable}" -c "{code}"'
+
+
+def test_runner_keeps_metric_lines_beyond_tail(tmp_path: Path) -> None:
+    code = (
+        "import sys; print('AUTOVRAM_METRIC it_per_s=4.0'); "
+        "[print('noise', i) for i in range(100)]; "
+        "sys.stderr.write('CUDA out of memory\\n' + 'x\\n' * 100)"
+    )
+    runner = SubprocessRunner(tail_lines=10)
+    outcome = runner.run(cmd=_py(code), env={}, timeout_s=30.0, cwd=tmp_path)
+
+    assert outcome.exit_code == 0
+    assert outcome.oom
+    assert not outcome.ok
+    assert parse_metric(outcome.stdout, "it_per_s") == 4.0
+    assert outcome.stdout.count("noise") == 10
+    assert outcome.stderr.startswith("CUDA out of memory\n")
+
+
+def test_runner_tolerates_invalid_utf8(tmp_path: Path) -> None:
+    code = (
+        "import sys; sys.stdout.buffer.write(b'\\xff\\xfe junk\\n'); sys.stdout.flush(); "
+        "print('AUTOVRAM_METRIC it_per_s=5.0')"
+    )
+    outcome = SubprocessRunner().run(cmd=_py(code), env={}, timeout_s=30.0, cwd=tmp_path)
+
+    assert outcome.ok
+    assert parse_metric(outcome.stdout, "it_per_s") == 5.0
+
+
+def test_runner_times_out(tmp_path: Path) -> None:
+    runner = SubprocessRunner()
+    outcome = runner.run(
+        cmd=_py("import time; time.sleep(30)"), env={}, timeout_s=0.5, cwd=tmp_path
+    )
+    assert outcome.timed_out
+    assert not outcome.ok
+
+
+def test_persistent_runner_reuses_process(tmp_path: Path) -> None:
+    script = tmp_path / "worker.py"
+    script.write_text(
+        "import os\n"
+        "from autovram.runtime import iter_runtime_configs, print_metric\n"
+        "for cfg in iter_runtime_configs():\n"
+        "    print_metric(it_per_s=cfg.batch_size, pid=os.getpid())\n",
+        encoding="utf-8",
+    )
+    cmd = f'"{sys.executable}" "{script}"'
+
+    runner = PersistentRunner()
+    try:
+        first = runner.run(cmd=cmd, env={"AUTOVRAM_BATCH_SIZE": "2"}, timeout_s=30.0, cwd=tmp_path)
+        second = runner.run(cmd=cmd, env={"AUTOVRAM_BATCH_SIZE": "8"}, timeout_s=30.0, cwd=tmp_path)
+    finally:
+        runner.close()
+
+    assert first.ok and second.ok
+    assert parse_metric(first.stdout, "it_per_s") == 2.0
+    assert parse_metric(second.stdout, "it_per_s") == 8.0
+    assert parse_metric(first.stdout, "pid") == parse_metric(second.stdout, "pid")
+
+
+def test_persistent_runner_bounds_stderr_per_trial(tmp_path: Path) -> None:
+    script = tmp_path / "noisy.py"
+    script.write_text(
+        "import sys\n"
+        "from autovram.runtime import iter_runtime_configs, print_metric\n"
+        "for cfg in iter_runtime_configs():\n"
+        "    for i in range(100_000):\n"
+        "        sys.stderr.write(f'progress {cfg.batch_size} {i:>80}\\n')\n"
+        "    print_metric(it_per_s=cfg.batch_size)\n",
+        encoding="utf-8",
+    )
+    cmd = f'"{sys.executable}" "{script}"'
+
+    runner = PersistentRunner(tail_lines=100)
+    tracemalloc.start()
+    try:
+        first = runner.run(cmd=cmd, env={"AUTOVRAM_BATCH_SIZE": "2"}, timeout_s=60.0, cwd=tmp_path)
+        second = runner.run(cmd=cmd, env={"AUTOVRAM_BATCH_SIZE": "8"}, timeout_s=60.0, cwd=tmp_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        runner.close()
+
+    assert first.ok and second.ok
+    assert peak < 4 * 1024 * 1024
+    assert first.stderr.count("\n") == second.stderr.count("\n") == 100
+    assert first.stderr.startswith("progress 2 ") and second.stderr.startswith("progress 8 ")
+
+
+def test_persistent_runner_falls_back_for_one_shot_scripts(tmp_path: Path) -> None:
+    cmd = _py("print('AUTOVRAM_METRIC it_per_s=3.0')")
+    runner = PersistentRunner()
+    try:
+        outcomes = [runner.run(cmd=cmd, env={}, timeout_s=30.0, cwd=tmp_path) for _ in range(2)]
+    finally:
+        runner.close()
+
+    assert all(o.ok for o in outcomes)
+    assert all(parse_metric(o.stdout, "it_per_s") == 3.0 for o in outcomes)
+
+
+def test_run_batch_splits_trials_and_stops_at_crash(tmp_path: Path) -> None:
+    script = tmp_path / "fused.py"
+    script.write_text(
+        "import sys\n"
+        "from autovram.runtime import iter_runtime_configs, print_metric\n"
+        "for cfg in iter_runtime_configs():\n"
+        "    if cfg.batch_size >= 4:\n"
+        "        sys.exit('CUDA out of memory')\n"
+        "    print_metric(it_per_s=cfg.batch_size)\n",
+        encoding="utf-8",
+    )
+    cmd = f'"{sys.executable}" "{script}"'
+    envs = [{"AUTOVRAM_BATCH_SIZE": str(bs)} for bs in (1, 2, 4, 8)]
+
+    outcomes = SubprocessRunner().run_batch(cmd=cmd, envs=envs, timeout_s=30.0, cwd=tmp_path)
+
+    assert [o.ok for o in outcomes] == [True, True, False]
+    assert [parse_metric(o.stdout, "it_per_s") for o in outcomes] == [1.0, 2.0, None]
+    assert outcomes[2].oom and outcomes[2].exit_code == 1
+
+
+def test_run_batch_times_out_per_trial(tmp_path: Path) -> None:
+    script = tmp_path / "slow.py"
+    script.write_text(
+        "import time\n"
+        "from autovram.runtime import iter_runtime_configs, print_metric\n"
+        "for cfg in iter_runtime_configs():\n"
+        "    time.sleep(0.5 * cfg.batch_size)\n"
+        "    print_metric(it_per_s=cfg.batch_size)\n",
+        encoding="utf-8",
+    )
+    cmd = f'"{sys.executable}" "{script}"'
+    envs = [{"AUTOVRAM_BATCH_SIZE": str(bs)} for bs in (1, 1, 6)]
+
+    outcomes = SubprocessRunner().run_batch(cmd=cmd, envs=envs, timeout_s=2.0, cwd=tmp_path)
+
+    assert [o.ok for o in outcomes] == [True, True, False]
+    assert outcomes[2].timed_out
+    assert all(0.4 < o.duration_s < 2.0 for o in outcomes[:2])
+
+
+def test_spawn_target_resolves_executable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    exe = Path(sys.executable)
+    monkeypatch.setenv("PATH", str(exe.parent))
+
+    args, cwd = _spawn_target(f"{exe.name} -c 'print(1)'", tmp_path)
+    assert args == [str(exe.parent / exe.name), "-c", "print(1)"]
+    assert cwd is None
+
+    _, cwd = _spawn_target("x", tmp_path / "..")
+    assert cwd == str(tmp_path / "..")
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_runner_pins_child_cpus(tmp_path: Path) -> None:
+    allowed = os.sched_getaffinity(0)
+    pin = (min(allowed),)
+
+    runner = SubprocessRunner(cpu_pin=pin)
+    outcome = runner.run(
+        cmd=_py("import os; print('AUTOVRAM_METRIC n_cpus=%d' % len(os.sched_getaffinity(0)))"),
+        env={},
+        timeout_s=30.0,
+        cwd=tmp_path,
+    )
+
+    assert parse_metric(outcome.stdout, "n_cpus") == 1.0
+    assert os.sched_getaffinity(0) == allowed
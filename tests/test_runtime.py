@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from autovram.runtime import get_runtime_config
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("reduce-overhead", "reduce-overhead"), ("  default \n", "default"), ("", None), ("  ", None)],
+)
+def test_runtime_config_reads_compile_mode(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: str | None
+) -> None:
+    monkeypatch.setenv("AUTOVRAM_COMPILE_MODE", raw)
+    assert get_runtime_config().compile_mode == expected
+
+
+def test_runtime_config_compile_mode_defaults_to_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AUTOVRAM_COMPILE_MODE", raising=False)
+    assert get_runtime_config().compile_mode is None
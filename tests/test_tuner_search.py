@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import gzip
 from dataclasses import replace
 from pathlib import Path
 
 from autovram.core.detect import detect_system
 from autovram.core.runner import SubprocessOutcome, SubprocessRunner
-from autovram.core.tuner import autotune_batch_size
-from autovram.core.types import AutoVRAMConfig, RunContext
+from autovram.core.tuner import (
+    autotune_batch_size,
+    ensure_run_dir,
+    run_script_trial,
+    write_trial_artifacts,
+)
+from autovram.core.types import AutoVRAMConfig, RunContext, RunResult
 
 
 class FakeRunner(SubprocessRunner):
-    def __init__(self, *, oom_at: int) -> None:
+    def __init__(
+        self,
+        *,
+        oom_at: int,
+        vram_model: tuple[float, float] | None = None,
+        saturate_at: int | None = None,
+    ) -> None:
         self.oom_at = oom_at
+        self.vram_model = vram_model
+        self.saturate_at = saturate_at
 
     def run(self, cmd: str, env: dict[str, str], timeout_s: float, cwd: Path) -> SubprocessOutcome:  # type: ignore[override]
         bs = int(env["AUTOVRAM_BATCH_SIZE"])
@@ -26,8 +40,11 @@ class FakeRunner(SubprocessRunner):
                 duration_s=0.01,
             )
         # Metric scales with batch size.
-        metric = 10.0 * bs
+        metric = 10.0 * (min(bs, self.saturate_at) if self.saturate_at else bs)
         stdout = f"AUTOVRAM_METRIC it_per_s={metric}\n"
+        if self.vram_model is not None:
+            a, b = self.vram_model
+            stdout += f"AUTOVRAM_METRIC vram_mib={a * bs + b}\n"
         return SubprocessOutcome(
             ok=True,
             exit_code=0,
@@ -65,6 +82,7 @@ def test_autotune_batch_size_binary_search(tmp_path: Path) -> None:
     assert best is not None
     assert best.batch_size == 3
     assert any(r.oom for r in results)
+    assert (tmp_path / "trials" / "trial_004" / "result.json").exists()
 
 
 def test_autotune_returns_none_if_all_bad(tmp_path: Path) -> None:
@@ -88,3 +106,194 @@ def test_autotune_returns_none_if_all_bad(tmp_path: Path) -> None:
         context=ctx, runner=runner, cmd="x", base_config=base, max_trials=5
     )
     assert best is None
+
+
+def test_autotune_concurrent_growth(tmp_path: Path) -> None:
+    system = detect_system()
+    ctx = RunContext(
+        mode="script",
+        system=system,
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="heuristic",
+    )
+
+    runner = FakeRunner(oom_at=6)
+    base = AutoVRAMConfig(batch_size=1, micro_batch=1, precision="fp16")
+
+    best, results = autotune_batch_size(
+        context=ctx,
+        runner=runner,
+        cmd="x",
+        base_config=base,
+        max_trials=10,
+        concurrency=4,
+        devices=["0", "1", "2", "3"],
+    )
+
+    assert best is not None
+    assert best.batch_size == 5
+    # Growth fans out over 1, 2, 4, 8; binary search then probes 6 and 5.
+    assert [r.config.batch_size for r in results] == [1, 2, 4, 8, 6, 5]
+
+
+def test_autotune_jumps_with_vram_model(tmp_path: Path) -> None:
+    system = replace(detect_system(), vram_total_mib=10_000)
+    ctx = RunContext(
+        mode="script",
+        system=system,
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="heuristic",
+    )
+
+    # vram = 100 * bs + 500 -> predicted max at 92% utilization is 87.
+    runner = FakeRunner(oom_at=90, vram_model=(100.0, 500.0))
+    base = AutoVRAMConfig(batch_size=1, micro_batch=1, precision="fp16")
+
+    best, results = autotune_batch_size(
+        context=ctx, runner=runner, cmd="x", base_config=base, max_trials=25
+    )
+
+    assert best is not None
+    assert best.batch_size == 87
+    assert [r.config.batch_size for r in results] == [1, 2, 87, 92]
+
+
+def test_ensure_run_dir_is_sequential(tmp_path: Path) -> None:
+    first = ensure_run_dir(tmp_path)
+    (tmp_path / "runs" / "notes").mkdir()
+    second = ensure_run_dir(tmp_path)
+
+    assert first.name == "000000"
+    assert second.name == "000001"
+
+
+def test_trial_artifacts_written_and_large_logs_compressed(tmp_path: Path) -> None:
+    rr = RunResult(
+        config=AutoVRAMConfig(),
+        ok=True,
+        exit_code=0,
+        timed_out=False,
+        oom=False,
+        metric_value=1.0,
+        stdout="x" * (128 * 1024),
+        stderr="warn\n",
+        duration_s=0.1,
+        artifacts_dir=tmp_path,
+    )
+    write_trial_artifacts(tmp_path, rr)
+
+    assert gzip.decompress((tmp_path / "stdout.txt.gz").read_bytes()) == rr.stdout.encode()
+    assert (tmp_path / "stderr.txt").read_text(encoding="utf-8") == "warn\n"
+    assert (tmp_path / "result.json").exists()
+
+    # Rewriting the dir with a small log must not leave the stale .gz behind.
+    write_trial_artifacts(tmp_path, replace(rr, stdout="small\n"))
+    assert (tmp_path / "stdout.txt").read_text(encoding="utf-8") == "small\n"
+    assert not (tmp_path / "stdout.txt.gz").exists()
+
+
+def test_autotune_stops_growth_on_plateau(tmp_path: Path) -> None:
+    ctx = RunContext(
+        mode="script",
+        system=detect_system(),
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="heuristic",
+    )
+
+    runner = FakeRunner(oom_at=1000, saturate_at=4)
+    base = AutoVRAMConfig(batch_size=1, micro_batch=1, precision="fp16")
+
+    best, results = autotune_batch_size(
+        context=ctx, runner=runner, cmd="x", base_config=base, max_trials=25
+    )
+
+    assert best is not None
+    assert best.batch_size == 4
+    assert [r.config.batch_size for r in results] == [1, 2, 4, 8, 16]
+
+
+class FusedFakeRunner(FakeRunner):
+    def __init__(self, *, oom_at: int) -> None:
+        super().__init__(oom_at=oom_at)
+        self.batches: list[list[int]] = []
+
+    def run_batch(  # type: ignore[override]
+        self, cmd: str, envs: list[dict[str, str]], timeout_s: float, cwd: Path
+    ) -> list[SubprocessOutcome]:
+        self.batches.append([int(env["AUTOVRAM_BATCH_SIZE"]) for env in envs])
+        outcomes: list[SubprocessOutcome] = []
+        for env in envs:
+            outcomes.append(self.run(cmd, env, timeout_s, cwd))
+            if not outcomes[-1].ok:
+                break
+        return outcomes
+
+
+def test_autotune_fused_growth(tmp_path: Path) -> None:
+    ctx = RunContext(
+        mode="script",
+        system=detect_system(),
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="heuristic",
+    )
+
+    runner = FusedFakeRunner(oom_at=6)
+    base = AutoVRAMConfig(batch_size=1, micro_batch=1, precision="fp16")
+
+    best, results = autotune_batch_size(
+        context=ctx, runner=runner, cmd="x", base_config=base, max_trials=10, fuse_growth=5
+    )
+
+    assert best is not None
+    assert best.batch_size == 5
+    # One child covers growth up to the first OOM; binary search runs per trial.
+    assert runner.batches == [[1, 2, 4, 8, 16]]
+    assert [r.config.batch_size for r in results] == [1, 2, 4, 8, 6, 5]
+    assert (tmp_path / "trials" / "trial_006" / "result.json").exists()
+
+
+class EnvRecordingRunner(FakeRunner):
+    def __init__(self) -> None:
+        super().__init__(oom_at=1000)
+        self.envs: list[dict[str, str]] = []
+
+    def run(self, cmd: str, env: dict[str, str], timeout_s: float, cwd: Path) -> SubprocessOutcome:  # type: ignore[override]
+        self.envs.append(env)
+        return super().run(cmd, env, timeout_s, cwd)
+
+
+def test_run_script_trial_passes_compile_mode(tmp_path: Path) -> None:
+    ctx = RunContext(
+        mode="script",
+        system=detect_system(),
+        metric_name="it_per_s",
+        timeout_s=1.0,
+        work_dir=tmp_path,
+        exec_cwd=tmp_path,
+        engine_name="heuristic",
+    )
+    runner = EnvRecordingRunner()
+
+    for i, mode in enumerate(("reduce-overhead", None)):
+        run_script_trial(
+            context=ctx,
+            runner=runner,
+            cmd="x",
+            config=AutoVRAMConfig(batch_size=2, compile_mode=mode),
+            trial_dir=tmp_path / f"trial_{i}",
+        )
+
+    assert runner.envs[0]["AUTOVRAM_COMPILE_MODE"] == "reduce-overhead"
+    assert "AUTOVRAM_COMPILE_MODE" not in runner.envs[1]